@@ -0,0 +1,237 @@
+"""Audit sink for admin actions.
+
+Views call ``record_audit(request, action)`` instead of creating
+``AdminAudit`` rows inline. The configured sink (``AUDIT_SINK``) decides how
+entries reach the database:
+
+- ``buffered`` (default): entries go to an in-process queue that a background
+  thread flushes with ``bulk_create`` every ``AUDIT_FLUSH_INTERVAL_SECONDS``
+  or once ``AUDIT_FLUSH_BATCH_SIZE`` entries are waiting. Pending entries are
+  flushed at process exit but lost if the process is killed.
+- ``durable``: at-least-once. Entries are appended to a Redis list
+  (``REDIS_URL``) and moved into the table by the ``flush_audit_log`` beat
+  task. Rows keep the id assigned at request time and are inserted with
+  ``ignore_conflicts``, so a flush that is retried after a crash does not
+  duplicate them. Without ``REDIS_URL`` it degrades to ``sync``.
+- ``sync``: one INSERT per entry in the request (previous behaviour).
+
+If the queue or Redis is unavailable, the entry is written synchronously
+rather than dropped.
+"""
+
+from __future__ import annotations
+
+import atexit
+import base64
+import binascii
+import json
+import logging
+import os
+import queue
+import threading
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, connection, transaction
+from django.utils.dateparse import parse_datetime
+
+from .models import AdminAudit
+
+logger = logging.getLogger(__name__)
+
+DURABLE_LIST_KEY = "audit:pending"
+_FLUSH_LOCK_KEY = "audit:flush-lock"
+
+
+def _batch_size() -> int:
+    return int(getattr(settings, "AUDIT_FLUSH_BATCH_SIZE", 200))
+
+
+def _insert(entries: list[AdminAudit]) -> None:
+    try:
+        with transaction.atomic():
+            AdminAudit.objects.bulk_create(entries, ignore_conflicts=True)
+    except IntegrityError:
+        # One bad row (e.g. its user was deleted before the flush) must not
+        # take the batch with it: insert one by one, keeping orphans anonymous
+        for entry in entries:
+            try:
+                with transaction.atomic():
+                    AdminAudit.objects.bulk_create([entry], ignore_conflicts=True)
+            except IntegrityError:
+                entry.user = None
+                AdminAudit.objects.bulk_create([entry], ignore_conflicts=True)
+
+
+class SyncSink:
+    def write(self, entry: AdminAudit) -> None:
+        entry.save(force_insert=True)
+
+    def flush(self) -> int:
+        return 0
+
+
+class BufferedSink:
+    """In-process queue flushed in batches by a daemon thread."""
+
+    def __init__(self, max_size: int | None = None, interval: float | None = None):
+        self.queue: queue.Queue[AdminAudit] = queue.Queue(
+            maxsize=max_size or int(getattr(settings, "AUDIT_BUFFER_MAX_SIZE", 10000))
+        )
+        self.interval = interval or float(
+            getattr(settings, "AUDIT_FLUSH_INTERVAL_SECONDS", 1.0)
+        )
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._flush_lock = threading.Lock()
+        atexit.register(self.flush)
+
+    def write(self, entry: AdminAudit) -> None:
+        try:
+            self.queue.put_nowait(entry)
+        except queue.Full:
+            # Writer fell behind; apply backpressure instead of losing the entry
+            entry.save(force_insert=True)
+            return
+        self._ensure_thread()
+        if self.queue.qsize() >= _batch_size():
+            self._wake.set()
+
+    def _ensure_thread(self) -> None:
+        # Threads don't survive fork (gunicorn preload); start one per process
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        self._pid = os.getpid()
+        self._thread = threading.Thread(
+            target=self._run, name="audit-flusher", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            finally:
+                # Connections are per thread; don't keep an idle one open
+                connection.close()
+
+    def flush(self) -> int:
+        """Write every queued entry; returns the number written."""
+        written = 0
+        with self._flush_lock:
+            while True:
+                batch = []
+                while len(batch) < _batch_size():
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if not batch:
+                    return written
+                try:
+                    _insert(batch)
+                    written += len(batch)
+                except Exception:
+                    logger.exception(f"Failed to write {len(batch)} audit entries")
+                    return written
+
+
+class DurableSink:
+    """Redis list drained by the ``flush_audit_log`` task (at-least-once)."""
+
+    def __init__(self, url: str):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+
+    def write(self, entry: AdminAudit) -> None:
+        payload = {
+            "id": str(entry.id),
+            "user_id": str(entry.user_id) if entry.user_id else None,
+            "path": entry.path,
+            "method": entry.method,
+            "action": entry.action,
+            "created_at": entry.created_at.isoformat(),
+        }
+        try:
+            self.client.rpush(DURABLE_LIST_KEY, json.dumps(payload))
+        except Exception:
+            logger.exception("Audit queue unavailable; writing entry directly")
+            entry.save(force_insert=True)
+
+    def flush(self) -> int:
+        """Move queued entries into the table; one consumer at a time."""
+        if not cache.add(_FLUSH_LOCK_KEY, 1, timeout=60):
+            return 0
+        written = 0
+        try:
+            while True:
+                raw = self.client.lrange(DURABLE_LIST_KEY, 0, _batch_size() - 1)
+                if not raw:
+                    return written
+                entries = []
+                for item in raw:
+                    data = json.loads(item)
+                    data["created_at"] = parse_datetime(data["created_at"])
+                    entries.append(AdminAudit(**data))
+                _insert(entries)
+                # Only trim after the insert committed; a crash in between
+                # re-inserts the same ids, which ignore_conflicts skips
+                self.client.ltrim(DURABLE_LIST_KEY, len(raw), -1)
+                written += len(raw)
+        finally:
+            cache.delete(_FLUSH_LOCK_KEY)
+
+
+def encode_cursor(created_at, entry_id) -> str:
+    raw = f"{created_at.isoformat()}|{entry_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """Return ``(created_at, id)`` from a cursor; ValueError if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_raw, entry_id = raw.split("|", 1)
+        created_at = parse_datetime(created_raw)
+        entry_id = uuid.UUID(entry_id)
+    except (ValueError, UnicodeDecodeError, binascii.Error) as e:
+        raise ValueError("invalid cursor") from e
+    if created_at is None:
+        raise ValueError("invalid cursor")
+    return created_at, entry_id
+
+
+_sinks: dict[str, object] = {}
+
+
+def get_sink():
+    mode = getattr(settings, "AUDIT_SINK", "buffered")
+    redis_url = getattr(settings, "REDIS_URL", "")
+    if mode == "durable" and not redis_url:
+        mode = "sync"
+    if mode not in _sinks:
+        if mode == "buffered":
+            _sinks[mode] = BufferedSink()
+        elif mode == "durable":
+            _sinks[mode] = DurableSink(redis_url)
+        else:
+            _sinks[mode] = SyncSink()
+    return _sinks[mode]
+
+
+def record_audit(request, action: str) -> None:
+    """Record an admin action performed in ``request``."""
+    user = getattr(request, "user", None)
+    get_sink().write(
+        AdminAudit(
+            user=user if user is not None and user.is_authenticated else None,
+            path=request.path,
+            method=request.method,
+            action=action[:128],
+        )
+    )
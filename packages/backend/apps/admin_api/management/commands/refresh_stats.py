@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from apps.admin_api.stats import refresh_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuild the admin dashboard rollups (same as the beat job)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=2,
+            help="Days of signups to recount; use a large value to backfill.",
+        )
+
+    def handle(self, *args, **options):
+        refresh_stats(days=max(options["days"], 1))
+        self.stdout.write(f"Refreshed stats ({options['days']} day(s) of signups)")
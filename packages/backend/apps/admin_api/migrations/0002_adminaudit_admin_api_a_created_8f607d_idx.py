@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-19 06:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("admin_api", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="adminaudit",
+            index=models.Index(
+                fields=["created_at"], name="admin_api_a_created_8f607d_idx"
+            ),
+        ),
+    ]
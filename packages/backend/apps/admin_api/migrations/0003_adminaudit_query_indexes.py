@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-19 06:55
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("admin_api", "0002_adminaudit_admin_api_a_created_8f607d_idx"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="adminaudit",
+            name="created_at",
+            field=models.DateTimeField(
+                default=django.utils.timezone.now, editable=False
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="adminaudit",
+            index=models.Index(
+                fields=["user", "created_at"], name="admin_api_a_user_id_ab45ac_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="adminaudit",
+            index=models.Index(
+                fields=["action", "created_at"],
+                name="adminaudit_action_idx",
+                opclasses=["varchar_pattern_ops", "timestamptz_ops"],
+            ),
+        ),
+    ]
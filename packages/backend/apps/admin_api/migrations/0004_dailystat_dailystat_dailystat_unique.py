@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("admin_api", "0003_adminaudit_query_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("metric", models.CharField(max_length=64)),
+                ("dimension", models.CharField(blank=True, default="", max_length=64)),
+                ("value", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="dailystat",
+            constraint=models.UniqueConstraint(
+                fields=("metric", "date", "dimension"), name="dailystat_unique"
+            ),
+        ),
+    ]
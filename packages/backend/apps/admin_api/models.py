@@ -4,6 +4,7 @@ import uuid
 
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.utils import timezone
 
 
 class AdminAudit(models.Model):
@@ -12,7 +13,44 @@ class AdminAudit(models.Model):
     path = models.CharField(max_length=512)
     method = models.CharField(max_length=10)
     action = models.CharField(max_length=128)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Set when the action happens, not when the buffered entry is flushed
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            # Retention purge (apps.retention) and unfiltered audit queries
+            models.Index(fields=["created_at"]),
+            # Audit query API: per user / per action prefix, newest first
+            models.Index(fields=["user", "created_at"]),
+            models.Index(
+                fields=["action", "created_at"],
+                name="adminaudit_action_idx",
+                # LIKE 'prefix%' can use the index under any collation (PostgreSQL)
+                opclasses=["varchar_pattern_ops", "timestamptz_ops"],
+            ),
+        ]
+
+
+class DailyStat(models.Model):
+    """One precomputed dashboard number (see apps.admin_api.stats).
+
+    ``dimension`` splits a metric (e.g. device tokens per platform); it is an
+    empty string for metrics without one.
+    """
+
+    date = models.DateField()
+    metric = models.CharField(max_length=64)
+    dimension = models.CharField(max_length=64, blank=True, default="")
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["metric", "date", "dimension"], name="dailystat_unique"
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - representation only
+        return f"DailyStat<{self.metric}:{self.dimension}@{self.date}>={self.value}"
@@ -0,0 +1,180 @@
+"""Precomputed admin dashboard rollups.
+
+``refresh_stats`` runs from Celery beat and writes ``DailyStat`` rows:
+
+- ``signups``: users joined per day. Only the last ``days`` days are
+  recounted (one grouped query over the ``date_joined`` index), so earlier
+  days are computed once and never touched again.
+- Snapshots, stored under today's date: ``active_orgs`` (per ``personal`` /
+  ``team``), ``members_per_org`` (organizations per member-count bucket),
+  ``memberships``, ``device_tokens`` (per platform) and ``pending_invites``.
+
+Rows are rebuilt by a periodic task rather than model signals: bulk inserts,
+queryset updates and the chunked deletion jobs bypass signals, and a recount
+corrects itself on the next run. ``/admin/api/stats`` reads a bounded number
+of rollup rows and never aggregates the source tables.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Max
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from apps.notifications.models import DeviceToken
+from apps.organizations.models import Organization, OrganizationInvite
+
+from .models import DailyStat
+
+SIGNUPS = "signups"
+ACTIVE_ORGS = "active_orgs"
+MEMBERS_PER_ORG = "members_per_org"
+MEMBERSHIPS = "memberships"
+DEVICE_TOKENS = "device_tokens"
+PENDING_INVITES = "pending_invites"
+SNAPSHOT_METRICS = [
+    ACTIVE_ORGS,
+    MEMBERS_PER_ORG,
+    MEMBERSHIPS,
+    DEVICE_TOKENS,
+    PENDING_INVITES,
+]
+
+# (label, upper bound inclusive); the last bucket is open-ended
+MEMBER_BUCKETS = [("1", 1), ("2-5", 5), ("6-25", 25), ("26+", None)]
+
+
+def _bucket(members: int) -> str:
+    for label, upper in MEMBER_BUCKETS:
+        if upper is None or members <= upper:
+            return label
+    raise AssertionError("unreachable")
+
+
+def _start_of(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _save(rows: list[DailyStat]) -> None:
+    DailyStat.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["metric", "date", "dimension"],
+        update_fields=["value", "updated_at"],
+    )
+
+
+def rollup_signups(today: date, days: int) -> None:
+    first = today - timedelta(days=days - 1)
+    counts = dict(
+        get_user_model()
+        .objects.filter(date_joined__gte=_start_of(first))
+        .annotate(day=TruncDate("date_joined"))
+        .values_list("day")
+        .annotate(n=Count("id"))
+        .values_list("day", "n")
+    )
+    now = timezone.now()
+    _save(
+        [
+            DailyStat(
+                date=first + timedelta(days=i),
+                metric=SIGNUPS,
+                value=counts.get(first + timedelta(days=i), 0),
+                updated_at=now,
+            )
+            for i in range(days)
+        ]
+    )
+
+
+def snapshot(today: date) -> None:
+    values: dict[tuple[str, str], int] = {}
+
+    orgs = (
+        Organization.objects.active().values_list("is_personal").annotate(n=Count("id"))
+    )
+    values[(ACTIVE_ORGS, "personal")] = 0
+    values[(ACTIVE_ORGS, "team")] = 0
+    for is_personal, n in orgs:
+        values[(ACTIVE_ORGS, "personal" if is_personal else "team")] = n
+
+    for label, _upper in MEMBER_BUCKETS:
+        values[(MEMBERS_PER_ORG, label)] = 0
+    sizes = (
+        Organization.objects.active()
+        .filter(member_count__gt=0)
+        .values_list("member_count", flat=True)
+    )
+    total = 0
+    for n in sizes.iterator():
+        values[(MEMBERS_PER_ORG, _bucket(n))] += 1
+        total += n
+    values[(MEMBERSHIPS, "")] = total
+
+    for platform, n in (
+        DeviceToken.objects.values_list("platform").annotate(n=Count("id")).order_by()
+    ):
+        values[(DEVICE_TOKENS, platform)] = n
+
+    values[(PENDING_INVITES, "")] = OrganizationInvite.objects.filter(
+        status=OrganizationInvite.STATUS_PENDING, expires_at__gt=timezone.now()
+    ).count()
+
+    now = timezone.now()
+    _save(
+        [
+            DailyStat(date=today, metric=m, dimension=d, value=v, updated_at=now)
+            for (m, d), v in values.items()
+        ]
+    )
+    # Platforms that no longer have tokens drop out of today's snapshot
+    DailyStat.objects.filter(date=today, metric=DEVICE_TOKENS).exclude(
+        dimension__in=[d for (m, d) in values if m == DEVICE_TOKENS]
+    ).delete()
+
+
+def refresh_stats(days: int = 2) -> None:
+    """Recount the last ``days`` days of signups and take today's snapshot."""
+    today = timezone.localdate()
+    rollup_signups(today, days)
+    snapshot(today)
+
+
+def read_stats(days: int) -> dict:
+    """Dashboard payload built from rollup rows only."""
+    today = timezone.localdate()
+    first = today - timedelta(days=days - 1)
+    signups = list(
+        DailyStat.objects.filter(metric=SIGNUPS, date__gte=first)
+        .order_by("date")
+        .values("date", "value")
+    )
+
+    latest = DailyStat.objects.filter(metric=ACTIVE_ORGS).aggregate(
+        day=Max("date"), updated_at=Max("updated_at")
+    )
+    current: dict[str, dict[str, int]] = {m: {} for m in SNAPSHOT_METRICS}
+    if latest["day"]:
+        for metric, dimension, value in DailyStat.objects.filter(
+            date=latest["day"], metric__in=SNAPSHOT_METRICS
+        ).values_list("metric", "dimension", "value"):
+            current[metric][dimension] = value
+
+    return {
+        "signups": {
+            "today": signups[-1]["value"]
+            if signups and signups[-1]["date"] == today
+            else 0,
+            "daily": signups,
+        },
+        "active_orgs": current[ACTIVE_ORGS],
+        "members_per_org": current[MEMBERS_PER_ORG],
+        "memberships": current[MEMBERSHIPS].get("", 0),
+        "device_tokens": current[DEVICE_TOKENS],
+        "pending_invites": current[PENDING_INVITES].get("", 0),
+        "as_of": latest["updated_at"],
+    }
@@ -0,0 +1,17 @@
+from celery import shared_task
+
+
+@shared_task(ignore_result=True)
+def flush_audit_log():
+    """Drain the durable audit queue into AdminAudit (AUDIT_SINK=durable)."""
+    from apps.admin_api.audit import get_sink
+
+    return get_sink().flush()
+
+
+@shared_task(ignore_result=True)
+def refresh_stats():
+    """Rebuild the admin dashboard rollups (see apps.admin_api.stats)."""
+    from apps.admin_api.stats import refresh_stats as refresh
+
+    refresh()
@@ -1,11 +1,14 @@
 from django.urls import path
 
 from .views import (
+    AuditLogView,
     FeatureFlagDetailView,
     FeatureFlagListCreateView,
     PingView,
     SendTestPushView,
+    StatsView,
     UserDetailView,
+    UserImportView,
     UsersListView,
 )
 
@@ -13,7 +16,10 @@ app_name = "admin_api"
 
 urlpatterns = [
     path("ping", PingView.as_view(), name="ping"),
+    path("audit", AuditLogView.as_view(), name="audit-log"),
+    path("stats", StatsView.as_view(), name="stats"),
     path("users", UsersListView.as_view(), name="users-list"),
+    path("users/import", UserImportView.as_view(), name="users-import"),
     path("users/<uuid:user_id>", UserDetailView.as_view(), name="user-detail"),
     path("push/send-test", SendTestPushView.as_view(), name="push-send-test"),
     path("features", FeatureFlagListCreateView.as_view(), name="featureflags-list"),
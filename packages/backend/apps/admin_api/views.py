@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from django.conf import settings
+from django.utils.dateparse import parse_datetime
 from rest_framework import serializers, status
 from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
@@ -8,9 +9,10 @@ from rest_framework.views import APIView
 
 from apps.featureflags.models import FeatureFlag
 from apps.featureflags.serializers import FeatureFlagSerializer
+from apps.notifications import push
 from apps.notifications.models import DeviceToken
 
-from .models import AdminAudit
+from .audit import record_audit
 
 # Legacy (fallback): pyfcm using server key
 try:
@@ -18,17 +20,6 @@ try:
 except Exception:  # pragma: no cover - optional dependency until installed
     FCMNotification = None
 
-# Preferred: Firebase Admin SDK (HTTP v1) using service account
-try:
-    import json
-
-    import firebase_admin
-    from firebase_admin import credentials, initialize_app, messaging
-except Exception:  # pragma: no cover - optional dependency until installed
-    firebase_admin = None
-    credentials = None
-    messaging = None
-
 
 class PingView(APIView):
     permission_classes = [IsAdminUser]
@@ -36,12 +27,7 @@ class PingView(APIView):
     throttle_classes: list = []
 
     def get(self, request):
-        AdminAudit.objects.create(
-            user=request.user,
-            path=request.path,
-            method=request.method,
-            action="ping",
-        )
+        record_audit(request, "ping")
         return Response({"ok": True})
 
 
@@ -53,10 +39,10 @@ class UsersListView(APIView):
 
     def get(self, request):
         from django.contrib.auth import get_user_model
-        from django.db.models import Count
+        from django.db.models import F
 
         User = get_user_model()
-        queryset = User.objects.annotate(token_count=Count("devicetoken"))
+        queryset = User.objects.all()
 
         # Apply filters
         email_filter = request.query_params.get("email")
@@ -79,12 +65,50 @@ class UsersListView(APIView):
             "is_active",
             "is_staff",
             "date_joined",
-            "token_count",
+            token_count=F("device_token_count"),
         ).order_by("-date_joined", "email")
 
         return Response({"users": list(users)})
 
 
+class UserImportView(APIView):
+    """Bulk-create users from a CSV or NDJSON request body.
+
+    Send ``Content-Type: text/csv`` (header row with ``email`` and optionally
+    ``first_name``, ``last_name``, ``password``) or ``application/x-ndjson``
+    (one JSON object per line). The body is read as a stream and written in
+    batches; see ``apps.users.bulk_import``.
+    """
+
+    permission_classes = [IsAdminUser]
+    throttle_scope = "admin"
+    content_types = {
+        "text/csv": "csv",
+        "application/x-ndjson": "ndjson",
+        "application/jsonl": "ndjson",
+    }
+
+    def post(self, request):
+        from apps.users.bulk_import import import_users, parse_rows
+
+        content_type = request.content_type.split(";")[0].strip().lower()
+        fmt = self.content_types.get(content_type)
+        if fmt is None:
+            return Response(
+                {"error": "Content-Type must be text/csv or application/x-ndjson"},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            )
+        stream = request.stream
+        if stream is None:
+            return Response(
+                {"error": "Request body is empty"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        result = import_users(parse_rows(iter(stream.readline, b""), fmt))
+        record_audit(request, f"user_import:{result.created}")
+        return Response({"data": result.as_dict()})
+
+
 class SendTestPushSerializer(serializers.Serializer):
     token = serializers.CharField(required=False)
     user_ids = serializers.ListField(
@@ -109,23 +133,10 @@ class SendTestPushView(APIView):
         body = serializer.validated_data.get("body")
 
         # Prefer HTTP v1 via Firebase Admin SDK
-        v1_available = (
-            firebase_admin is not None
-            and credentials is not None
-            and messaging is not None
-        )
-        sa_path = getattr(settings, "GOOGLE_APPLICATION_CREDENTIALS", "")
-        sa_json = getattr(settings, "GOOGLE_SERVICE_ACCOUNT_JSON", "")
-
-        if v1_available and (sa_path or sa_json):
+        if push.v1_configured():
             # Lazy init default app
             try:
-                if not firebase_admin._apps:  # type: ignore[attr-defined]
-                    if sa_json:
-                        cred = credentials.Certificate(json.loads(sa_json))
-                    else:
-                        cred = credentials.Certificate(sa_path)
-                    initialize_app(cred)
+                push.ensure_firebase_app()
             except Exception as e:  # pragma: no cover
                 return Response(
                     {"error": f"Failed to initialize Firebase Admin SDK: {e}"},
@@ -162,25 +173,11 @@ class SendTestPushView(APIView):
                         status=status.HTTP_400_BAD_REQUEST,
                     )
 
-            results = []
-            for t in tokens:
-                try:
-                    msg = messaging.Message(
-                        token=t,
-                        notification=messaging.Notification(title=title, body=body),
-                        data={"source": "admin_test"},
-                    )
-                    resp = messaging.send(msg)
-                    results.append({"token": t, "message_id": resp})
-                except Exception as e:  # pragma: no cover
-                    results.append({"token": t, "error": str(e)})
-
-            AdminAudit.objects.create(
-                user=request.user,
-                path=request.path,
-                method=request.method,
-                action="push_send_test_v1",
+            results = push.send_to_tokens(
+                tokens, title, body, data={"source": "admin_test"}
             )
+
+            record_audit(request, "push_send_test_v1")
             return Response({"sent": True, "targets": len(tokens), "results": results})
 
         # Fallback to legacy server key (deprecated by Google). Useful if already configured.
@@ -227,12 +224,7 @@ class SendTestPushView(APIView):
             )
             targets = len(tokens)
 
-        AdminAudit.objects.create(
-            user=request.user,
-            path=request.path,
-            method=request.method,
-            action="push_send_test_legacy",
-        )
+        record_audit(request, "push_send_test_legacy")
 
         return Response({"sent": True, "targets": targets, "result": result})
 
@@ -245,14 +237,13 @@ class UserDetailView(APIView):
 
     def get(self, request, user_id):
         from django.contrib.auth import get_user_model
-        from django.db.models import Count
+        from django.db.models import F
         from rest_framework.exceptions import NotFound
 
         User = get_user_model()
         try:
             user = (
                 User.objects.filter(id=user_id)
-                .annotate(token_count=Count("devicetoken"))
                 .values(
                     "id",
                     "email",
@@ -263,7 +254,8 @@ class UserDetailView(APIView):
                     "is_superuser",
                     "date_joined",
                     "last_login",
-                    "token_count",
+                    "deletion_requested_at",
+                    token_count=F("device_token_count"),
                 )
                 .get()
             )
@@ -275,37 +267,48 @@ class UserDetailView(APIView):
     def delete(self, request, user_id):
         from django.contrib.auth import get_user_model
         from django.db import transaction
+        from django.utils import timezone
         from rest_framework.exceptions import NotFound
 
+        from apps.organizations.models import Organization
+        from apps.outbox.relay import enqueue_task
+        from apps.users.tasks import delete_user_account
+        from boilerplate import task_status
+
         User = get_user_model()
         try:
             user = User.objects.get(id=user_id)
         except User.DoesNotExist:
             raise NotFound("User not found") from None
 
-        email = user.email
-
-        # Log the audit before deletion
-        AdminAudit.objects.create(
-            user=request.user,
-            path=request.path,
-            method=request.method,
-            action=f"delete_user:{email}",
-        )
-
-        # Use transaction to ensure consistency
-        try:
-            with transaction.atomic():
-                user.delete()
-        except Exception as e:
-            # Log the error but still return a meaningful response
+        if user.deletion_requested_at:
             return Response(
-                {"detail": f"Error deleting user: {str(e)}"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                {"error": "User deletion already in progress"},
+                status=status.HTTP_409_CONFLICT,
             )
 
+        email = user.email
+        record_audit(request, f"delete_user:{email}")
+
+        # Deactivate now (blocks logins and API tokens); rows are removed in
+        # chunks by a background task
+        with transaction.atomic():
+            now = timezone.now()
+            User.objects.filter(pk=user.pk).update(
+                is_active=False, deletion_requested_at=now
+            )
+            # Organizations owned by the user go with the account
+            Organization.objects.filter(owner_id=user.pk).update(
+                deletion_requested_at=now
+            )
+            job_id = task_status.track_task(
+                request.user.id, message=f"Deleting user {email}"
+            )
+            enqueue_task(delete_user_account, str(user.id), job_id=job_id)
+
         return Response(
-            {"detail": f"User {email} deleted successfully"}, status=status.HTTP_200_OK
+            {"detail": f"User {email} scheduled for deletion", "job_id": job_id},
+            status=status.HTTP_202_ACCEPTED,
         )
 
 
@@ -324,12 +327,7 @@ class FeatureFlagListCreateView(APIView):
         ser = FeatureFlagSerializer(data=request.data)
         ser.is_valid(raise_exception=True)
         obj = ser.save()
-        AdminAudit.objects.create(
-            user=request.user,
-            path=request.path,
-            method=request.method,
-            action=f"featureflag_create:{obj.key}",
-        )
+        record_audit(request, f"featureflag_create:{obj.key}")
         return Response(FeatureFlagSerializer(obj).data, status=status.HTTP_201_CREATED)
 
 
@@ -356,22 +354,107 @@ class FeatureFlagDetailView(APIView):
         ser = FeatureFlagSerializer(obj, data=request.data, partial=True)
         ser.is_valid(raise_exception=True)
         ser.save()
-        AdminAudit.objects.create(
-            user=request.user,
-            path=request.path,
-            method=request.method,
-            action=f"featureflag_update:{obj.key}",
-        )
+        record_audit(request, f"featureflag_update:{obj.key}")
         return Response(FeatureFlagSerializer(obj).data)
 
     def delete(self, request, flag_id):
         obj = self.get_object(flag_id)
         key = obj.key
         obj.delete()
-        AdminAudit.objects.create(
-            user=request.user,
-            path=request.path,
-            method=request.method,
-            action=f"featureflag_delete:{key}",
-        )
+        record_audit(request, f"featureflag_delete:{key}")
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class AuditLogView(APIView):
+    """Query the admin audit log, newest first, with keyset pagination.
+
+    Filters: ``user`` (id), ``action`` (prefix, e.g. ``featureflag_``),
+    ``since`` / ``until`` (ISO 8601). Pass the returned ``next_cursor`` as
+    ``cursor`` to fetch the next page; each page is one index range scan
+    regardless of how deep it is.
+    """
+
+    permission_classes = [IsAdminUser]
+    throttle_scope = "admin"
+    default_limit = 50
+    max_limit = 200
+
+    def get(self, request):
+        from django.db.models import Q
+
+        from .audit import decode_cursor, encode_cursor
+        from .models import AdminAudit
+
+        params = request.query_params
+        qs = AdminAudit.objects.all()
+        try:
+            limit = min(int(params.get("limit", self.default_limit)), self.max_limit)
+            if limit < 1:
+                raise ValueError
+        except ValueError:
+            return Response(
+                {"error": "limit must be a positive integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if params.get("user"):
+            qs = qs.filter(user_id=params["user"])
+        if params.get("action"):
+            qs = qs.filter(action__startswith=params["action"])
+        for name, lookup in (("since", "created_at__gte"), ("until", "created_at__lt")):
+            if params.get(name):
+                value = parse_datetime(params[name])
+                if value is None:
+                    return Response(
+                        {"error": f"{name} must be an ISO 8601 datetime"},
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
+                qs = qs.filter(**{lookup: value})
+        if params.get("cursor"):
+            try:
+                created_at, entry_id = decode_cursor(params["cursor"])
+            except ValueError:
+                return Response(
+                    {"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST
+                )
+            qs = qs.filter(
+                Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=entry_id)
+            )
+
+        rows = list(
+            qs.order_by("-created_at", "-id").values(
+                "id", "user_id", "user__email", "path", "method", "action", "created_at"
+            )[: limit + 1]
+        )
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+        return Response({"data": rows, "count": len(rows), "next_cursor": next_cursor})
+
+
+class StatsView(APIView):
+    """Dashboard numbers from the precomputed rollups (apps.admin_api.stats).
+
+    ``days`` (default 30, max 365) sets the length of the daily signup
+    series; everything else is the latest snapshot.
+    """
+
+    permission_classes = [IsAdminUser]
+    throttle_scope = "admin"
+    default_days = 30
+    max_days = 365
+
+    def get(self, request):
+        from .stats import read_stats
+
+        try:
+            days = int(request.query_params.get("days", self.default_days))
+            if not 1 <= days <= self.max_days:
+                raise ValueError
+        except ValueError:
+            return Response(
+                {"error": f"days must be between 1 and {self.max_days}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response({"data": read_stats(days)})
@@ -0,0 +1,8 @@
+from django.contrib import admin
+
+from .models import ExportWatermark
+
+
+@admin.register(ExportWatermark)
+class ExportWatermarkAdmin(admin.ModelAdmin):
+    list_display = ("table", "last_timestamp", "rows_exported", "updated_at")
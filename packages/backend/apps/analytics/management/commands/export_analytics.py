@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.analytics.exporter import TABLES, export_table, get_table, reset
+from apps.analytics.models import ExportWatermark
+
+
+class Command(BaseCommand):
+    help = "Export rows changed since the last run to the analytics storage."
+
+    def add_arguments(self, parser):
+        parser.add_argument("tables", nargs="*", help="Table names (default: all).")
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Drop the watermark first and re-export the table from the start.",
+        )
+        parser.add_argument(
+            "--list", action="store_true", help="List tables with their watermark."
+        )
+
+    def handle(self, *args, **options):
+        if options["list"]:
+            watermarks = {w.table: w for w in ExportWatermark.objects.all()}
+            for table in TABLES:
+                mark = watermarks.get(table.name)
+                position = mark.last_timestamp if mark else "never exported"
+                self.stdout.write(
+                    f"{table.name}: {table.model}.{table.timestamp_field} ({position})"
+                )
+            return
+
+        try:
+            tables = [get_table(n) for n in options["tables"]] or TABLES
+        except KeyError as e:
+            raise CommandError(str(e)) from e
+
+        for table in tables:
+            if options["reset"]:
+                reset(table)
+            rows = export_table(table, batch_size=options["batch_size"])
+            self.stdout.write(f"{table.name}: exported {rows} row(s)")
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="ExportWatermark",
+            fields=[
+                (
+                    "table",
+                    models.CharField(max_length=64, primary_key=True, serialize=False),
+                ),
+                ("last_timestamp", models.DateTimeField(blank=True, null=True)),
+                ("last_pk", models.CharField(blank=True, max_length=64)),
+                ("rows_exported", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from django.db import models
+
+
+class ExportWatermark(models.Model):
+    """Position of the incremental analytics export for one table.
+
+    Rows are exported in ``(timestamp, pk)`` order; the watermark is the last
+    exported pair, so the next run resumes strictly after it.
+    """
+
+    table = models.CharField(max_length=64, primary_key=True)
+    last_timestamp = models.DateTimeField(null=True, blank=True)
+    last_pk = models.CharField(max_length=64, blank=True)
+    rows_exported = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:  # pragma: no cover - representation only
+        return f"ExportWatermark<{self.table}@{self.last_timestamp}>"
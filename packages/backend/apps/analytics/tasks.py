@@ -0,0 +1,26 @@
+import logging
+
+from celery import shared_task
+
+from apps.analytics.exporter import TABLES, export_table, get_table
+from boilerplate.dedup import DeduplicatedTask
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def export_analytics():
+    """Beat entry point: fan out one export task per table."""
+    for table in TABLES:
+        export_analytics_table.delay(table.name)
+
+
+# The lock keeps two runs from writing the same table and racing on its watermark
+@shared_task(base=DeduplicatedTask, ignore_result=True, dedup_done_ttl=60)
+def export_analytics_table(table_name):
+    try:
+        table = get_table(table_name)
+    except KeyError:
+        logger.error(f"Unknown analytics table {table_name}")
+        return 0
+    return export_table(table)
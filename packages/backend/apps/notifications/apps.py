@@ -5,3 +5,8 @@ class NotificationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.notifications"
     label = "notifications"
+
+    def ready(self):
+        from boilerplate import counters
+
+        counters.connect("notifications.DeviceToken")
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-19 06:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "notifications",
+            "0002_rename_notifications_platform_idx_notificatio_platfor_0d3ecd_idx_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                condition=models.Q(("read_at__isnull", False)),
+                fields=["read_at"],
+                name="notification_read_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("notifications", "0003_notification_notification_read_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="devicetoken",
+            index=models.Index(
+                fields=["updated_at", "id"], name="devicetoken_export_idx"
+            ),
+        ),
+    ]
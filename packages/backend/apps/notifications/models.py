@@ -17,6 +17,14 @@ class Notification(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            # Retention purge of read notifications (apps.retention)
+            models.Index(
+                fields=["read_at"],
+                condition=models.Q(read_at__isnull=False),
+                name="notification_read_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Notification<{self.type}> to {self.recipient}"
@@ -46,6 +54,7 @@ class DeviceToken(models.Model):
         indexes = [
             models.Index(fields=["platform"]),
             models.Index(fields=["created_at"]),
+            models.Index(fields=["updated_at", "id"], name="devicetoken_export_idx"),
         ]
         ordering = ("-created_at",)
 
@@ -0,0 +1,60 @@
+"""FCM HTTP v1 push delivery via the Firebase Admin SDK.
+
+Shared by the admin test-push endpoint and the push Celery tasks.
+"""
+
+from __future__ import annotations
+
+import json
+
+from django.conf import settings
+
+try:
+    import firebase_admin
+    from firebase_admin import credentials, initialize_app, messaging
+except Exception:  # pragma: no cover - optional dependency until installed
+    firebase_admin = None
+    credentials = None
+    messaging = None
+
+
+def v1_configured() -> bool:
+    """True when the Admin SDK is installed and a service account is set."""
+    available = (
+        firebase_admin is not None and credentials is not None and messaging is not None
+    )
+    sa_path = getattr(settings, "GOOGLE_APPLICATION_CREDENTIALS", "")
+    sa_json = getattr(settings, "GOOGLE_SERVICE_ACCOUNT_JSON", "")
+    return available and bool(sa_path or sa_json)
+
+
+def ensure_firebase_app() -> None:
+    """Lazily initialize the default Firebase app (once per process)."""
+    if firebase_admin._apps:  # type: ignore[attr-defined]
+        return
+    sa_json = getattr(settings, "GOOGLE_SERVICE_ACCOUNT_JSON", "")
+    if sa_json:
+        cred = credentials.Certificate(json.loads(sa_json))
+    else:
+        cred = credentials.Certificate(settings.GOOGLE_APPLICATION_CREDENTIALS)
+    initialize_app(cred)
+
+
+def send_to_tokens(
+    tokens: list[str], title: str, body: str, data: dict[str, str] | None = None
+) -> list[dict]:
+    """Send one notification per token; returns a result dict per token."""
+    ensure_firebase_app()
+    results = []
+    for t in tokens:
+        try:
+            msg = messaging.Message(
+                token=t,
+                notification=messaging.Notification(title=title, body=body),
+                data=data or {},
+            )
+            resp = messaging.send(msg)
+            results.append({"token": t, "message_id": resp})
+        except Exception as e:  # pragma: no cover
+            results.append({"token": t, "error": str(e)})
+    return results
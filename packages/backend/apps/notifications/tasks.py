@@ -0,0 +1,31 @@
+import logging
+
+from celery import shared_task
+
+from apps.notifications import push
+from apps.notifications.models import DeviceToken
+from boilerplate.dedup import DeduplicatedTask
+
+logger = logging.getLogger(__name__)
+
+
+# Short done window: drops double-clicks/redeliveries, allows deliberate repeats
+@shared_task(base=DeduplicatedTask, ignore_result=True, dedup_done_ttl=60)
+def send_push_to_users(user_ids, title, body, data=None):
+    """Push a notification to every web device token of the given users."""
+    if not push.v1_configured():
+        logger.warning(
+            "Push not configured; skipping send to %d user(s)", len(user_ids)
+        )
+        return 0
+    tokens = list(
+        DeviceToken.objects.filter(
+            user_id__in=user_ids, platform=DeviceToken.PLATFORM_WEB
+        ).values_list("token", flat=True)
+    )
+    if not tokens:
+        return 0
+    results = push.send_to_tokens(tokens, title, body, data)
+    sent = sum(1 for r in results if "message_id" in r)
+    logger.info("Push sent to %d of %d token(s)", sent, len(tokens))
+    return sent
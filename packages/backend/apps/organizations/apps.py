@@ -5,3 +5,8 @@ class OrganizationsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.organizations"
     label = "organizations"
+
+    def ready(self):
+        from boilerplate import counters
+
+        counters.connect("organizations.Membership")
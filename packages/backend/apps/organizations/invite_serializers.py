@@ -23,6 +23,18 @@ class InviteSerializer(serializers.Serializer):
         return obj.invited_by.email if obj.invited_by else None
 
 
+class BulkInviteSerializer(serializers.Serializer):
+    """Envelope for bulk invites; items are validated one by one in the view."""
+
+    MAX_INVITES = 500
+
+    invites = serializers.ListField(
+        child=serializers.DictField(),
+        allow_empty=False,
+        max_length=MAX_INVITES,
+    )
+
+
 class MembershipRoleUpdateSerializer(serializers.Serializer):
     """Serializer for updating a member's role."""
 
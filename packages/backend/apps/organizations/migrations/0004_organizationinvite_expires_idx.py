@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-19 06:52
+#
+# Hand-edited: makemigrations also emitted pre-existing drift on
+# OrganizationInvite (Meta options, constraint removal, index renames, FK
+# alterations, unique_together). Those operations are unrelated to this change
+# and were removed; only the retention index on expires_at is added here.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0003_organizationinvite"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="organizationinvite",
+            index=models.Index(
+                fields=["expires_at"], name="organizatio_expires_c4a92f_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-19 06:56
+#
+# Hand-edited: makemigrations also emitted pre-existing drift on
+# OrganizationInvite (see 0004); only the new Organization field is kept.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0004_organizationinvite_expires_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="organization",
+            name="deletion_requested_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:01
+#
+# Hand-edited: makemigrations also emitted pre-existing drift on
+# OrganizationInvite (see 0004); only the new export indexes are kept.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("organizations", "0005_organization_deletion_requested_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="membership",
+            index=models.Index(
+                fields=["created_at", "id"], name="membership_export_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="organization",
+            index=models.Index(
+                fields=["updated_at", "id"], name="org_updated_export_idx"
+            ),
+        ),
+    ]
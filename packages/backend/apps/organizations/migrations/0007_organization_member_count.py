@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:05
+#
+# Hand-edited: makemigrations also emitted pre-existing drift on
+# OrganizationInvite (see 0004); only the new field is kept, plus a backfill
+# of the counter from existing memberships.
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill(apps, schema_editor):
+    Organization = apps.get_model("organizations", "Organization")
+    Membership = apps.get_model("organizations", "Membership")
+    counts = (
+        Membership.objects.filter(organization=OuterRef("pk"))
+        .order_by()
+        .values("organization")
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+    Organization.objects.update(member_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("organizations", "0006_analytics_export_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="organization",
+            name="member_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -6,6 +6,12 @@ from django.conf import settings
 from django.db import models
 
 
+class OrganizationQuerySet(models.QuerySet):
+    def active(self):
+        """Organizations that are not being deleted."""
+        return self.filter(deletion_requested_at__isnull=True)
+
+
 class Organization(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=255)
@@ -21,6 +27,19 @@ class Organization(models.Model):
     is_personal = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Set when the organization is closed; its rows are removed in chunks by
+    # apps.organizations.tasks.delete_organization
+    deletion_requested_at = models.DateTimeField(null=True, blank=True)
+    # Maintained by boilerplate.counters; repair with `manage.py reconcile_counters`
+    member_count = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = OrganizationQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Incremental analytics export (apps.analytics) reads in this order
+            models.Index(fields=["updated_at", "id"], name="org_updated_export_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.name
@@ -44,6 +63,9 @@ class Membership(models.Model):
 
     class Meta:
         unique_together = ("user", "organization")
+        indexes = [
+            models.Index(fields=["created_at", "id"], name="membership_export_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user} @ {self.organization} ({self.role})"
@@ -126,6 +148,8 @@ class OrganizationInvite(models.Model):
         indexes = [
             models.Index(fields=["invited_email", "status"]),
             models.Index(fields=["organization", "status"]),
+            # Retention purge (apps.retention)
+            models.Index(fields=["expires_at"]),
         ]
         ordering = ("-created_at",)
 
@@ -2,32 +2,20 @@ import logging
 
 from celery import shared_task
 from django.conf import settings
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
 
 from apps.organizations.models import OrganizationInvite
+from boilerplate import task_status
+from boilerplate.dedup import DeduplicatedTask
+from boilerplate.mail import render_cached, send_email
 
 logger = logging.getLogger(__name__)
 
+# Invites emailed per batch task in bulk sends (one pooled connection each)
+INVITE_EMAIL_BATCH_SIZE = 50
 
-@shared_task
-def send_org_invite_email(invite_id):
-    """
-    Send organization invitation email to invited user.
-    Follows the same pattern as magic link email sending.
-    """
-    try:
-        invite = OrganizationInvite.objects.select_related(
-            "organization", "invited_by"
-        ).get(id=invite_id)
-    except OrganizationInvite.DoesNotExist:
-        logger.error(f"OrganizationInvite {invite_id} not found")
-        return
-
-    if invite.status != OrganizationInvite.STATUS_PENDING:
-        logger.info(f"Invite {invite_id} is not pending, skipping email")
-        return
 
+def _build_invite_email(invite):
+    """Return (subject, text_body, html_body) for an invite."""
     # Build accept link using MAGIC_LINK_VERIFY_URL (same as magic link auth)
     frontend_base = getattr(settings, "MAGIC_LINK_VERIFY_URL", "http://localhost:8080")
     # Strip any path component to get just the origin
@@ -49,7 +37,7 @@ def send_org_invite_email(invite_id):
         f"This invitation expires in 7 days."
     )
 
-    html_body = render_to_string(
+    html_body = render_cached(
         "organizations/invite_email.html",
         {
             "inviter_name": inviter_name,
@@ -57,19 +45,86 @@ def send_org_invite_email(invite_id):
             "accept_url": accept_url,
         },
     )
+    return subject, text_body, html_body
 
+
+@shared_task(base=DeduplicatedTask)
+def send_org_invite_email(invite_id):
+    """
+    Send organization invitation email to invited user.
+    Follows the same pattern as magic link email sending.
+    """
     try:
-        send_mail(
-            subject,
-            text_body,
-            getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@example.local"),
-            [invite.invited_email],
-            html_message=html_body,
-            fail_silently=True,
-        )
+        invite = OrganizationInvite.objects.select_related(
+            "organization", "invited_by"
+        ).get(id=invite_id)
+    except OrganizationInvite.DoesNotExist:
+        logger.error(f"OrganizationInvite {invite_id} not found")
+        return
+
+    if invite.status != OrganizationInvite.STATUS_PENDING:
+        logger.info(f"Invite {invite_id} is not pending, skipping email")
+        return
+
+    subject, text_body, html_body = _build_invite_email(invite)
+
+    try:
+        send_email(subject, text_body, [invite.invited_email], html_body=html_body)
         logger.info(
             f"Invitation email sent to {invite.invited_email} for org {invite.organization.id}"
         )
     except Exception as e:
         logger.error(f"Failed to send invite email for invite {invite_id}: {str(e)}")
         raise
+
+
+@shared_task(base=DeduplicatedTask, ignore_result=True)
+def send_org_invite_emails_batch(invite_ids, job_id=None):
+    """Send invitation emails for a batch of invites.
+
+    Loads the batch in one query and sends every message over the worker's
+    pooled email connection. Invites that are no longer pending are skipped.
+    When ``job_id`` is given, progress is reported to the task status store.
+    """
+    invites = OrganizationInvite.objects.select_related(
+        "organization", "invited_by"
+    ).filter(id__in=invite_ids, status=OrganizationInvite.STATUS_PENDING)
+
+    sent = 0
+    for invite in invites:
+        subject, text_body, html_body = _build_invite_email(invite)
+        try:
+            sent += send_email(
+                subject, text_body, [invite.invited_email], html_body=html_body
+            )
+        except Exception as e:
+            logger.error(f"Failed to send invite email for invite {invite.id}: {e}")
+    logger.info(f"Sent {sent} of {len(invite_ids)} invitation emails in batch")
+    if job_id:
+        task_status.advance(job_id, len(invite_ids))
+    return sent
+
+
+def enqueue_invite_emails(invite_ids, job_id=None):
+    """Write one outbox row per batch of invites (call inside the transaction).
+
+    The outbox relay publishes each batch to the email queue after commit.
+    """
+    from apps.outbox.relay import enqueue_many
+
+    ids = [str(i) for i in invite_ids]
+    return enqueue_many(
+        send_org_invite_emails_batch,
+        (
+            [ids[i : i + INVITE_EMAIL_BATCH_SIZE], job_id]
+            for i in range(0, len(ids), INVITE_EMAIL_BATCH_SIZE)
+        ),
+    )
+
+
+@shared_task(base=DeduplicatedTask, ignore_result=True, dedup_done_ttl=60)
+def delete_organization(org_id, job_id=None):
+    """Delete a closed organization chunk by chunk (see boilerplate.deletion)."""
+    from boilerplate.deletion import organization_plan, run_plan
+
+    return run_plan(organization_plan(org_id), job_id=job_id)
@@ -3,6 +3,7 @@ from django.urls import path
 from .views import (
     MembershipRoleUpdateView,
     MyPendingInvitesView,
+    OrganizationBulkInviteCreateView,
     OrganizationCloseView,
     OrganizationCreateView,
     OrganizationDetailView,
@@ -48,6 +49,11 @@ urlpatterns = [
         OrganizationInviteCreateView.as_view(),
         name="create-invite",
     ),
+    path(
+        "<uuid:org_id>/invites/bulk/",
+        OrganizationBulkInviteCreateView.as_view(),
+        name="bulk-create-invites",
+    ),
     path(
         "<uuid:org_id>/invites/<uuid:invite_id>/revoke/",
         OrganizationInviteRevokeView.as_view(),
@@ -5,6 +5,7 @@ from datetime import timedelta
 
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.db.models.functions import Lower
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from rest_framework import serializers, status
@@ -14,10 +15,19 @@ from rest_framework.views import APIView
 
 from apps.notifications.models import Notification
 from apps.organizations.invite_serializers import (
+    BulkInviteSerializer,
     InviteSerializer,
     MembershipRoleUpdateSerializer,
 )
 from apps.organizations.models import Membership, Organization, OrganizationInvite
+from apps.outbox.relay import enqueue_task
+from boilerplate import task_status
+
+
+def make_invite_token_hash(org: Organization, invited_email: str) -> str:
+    """Return the token hash used in an invite's accept link."""
+    raw_token = f"{org.id}:{invited_email}:{timezone.now().timestamp()}"
+    return hashlib.sha256(raw_token.encode()).hexdigest()
 
 
 class OrganizationSerializer(serializers.Serializer):
@@ -36,7 +46,7 @@ class OrganizationListView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        orgs = request.user.organizations.all().order_by("-membership__created_at")
+        orgs = request.user.organizations.active().order_by("-membership__created_at")
         data = []
         for org in orgs:
             membership = Membership.objects.get(user=request.user, organization=org)
@@ -47,6 +57,7 @@ class OrganizationListView(APIView):
                     "is_personal": org.is_personal,
                     "owner_id": str(org.owner_id),
                     "role": membership.role,
+                    "member_count": org.member_count,
                     "is_current": org.id
                     == getattr(request.user.current_organization, "id", None),
                 }
@@ -100,7 +111,9 @@ class OrganizationDetailView(APIView):
 
     def get(self, request, org_id):
         # Ensure user is a member
-        org = get_object_or_404(Organization, id=org_id, members=request.user)
+        org = get_object_or_404(
+            Organization.objects.active(), id=org_id, members=request.user
+        )
         membership = Membership.objects.get(user=request.user, organization=org)
 
         return Response(
@@ -111,6 +124,7 @@ class OrganizationDetailView(APIView):
                     "is_personal": org.is_personal,
                     "owner_id": str(org.owner_id),
                     "role": membership.role,
+                    "member_count": org.member_count,
                     "is_current": org.id
                     == getattr(request.user.current_organization, "id", None),
                     "created_at": org.created_at.isoformat(),
@@ -126,7 +140,9 @@ class OrganizationSwitchView(APIView):
 
     def post(self, request, org_id):
         # Verify user is a member of the target organization
-        org = get_object_or_404(Organization, id=org_id, members=request.user)
+        org = get_object_or_404(
+            Organization.objects.active(), id=org_id, members=request.user
+        )
 
         request.user.current_organization = org
         request.user.save(update_fields=["current_organization"])
@@ -154,7 +170,9 @@ class OrganizationMembersView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, org_id):
-        org = get_object_or_404(Organization, id=org_id, members=request.user)
+        org = get_object_or_404(
+            Organization.objects.active(), id=org_id, members=request.user
+        )
 
         members = []
         for m in Membership.objects.filter(organization=org).select_related("user"):
@@ -179,7 +197,9 @@ class OrganizationInviteListView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, org_id):
-        org = get_object_or_404(Organization, id=org_id, members=request.user)
+        org = get_object_or_404(
+            Organization.objects.active(), id=org_id, members=request.user
+        )
 
         # Check admin role
         membership = Membership.objects.get(user=request.user, organization=org)
@@ -237,7 +257,9 @@ class OrganizationInviteCreateView(APIView):
 
     @transaction.atomic
     def post(self, request, org_id):
-        org = get_object_or_404(Organization, id=org_id, members=request.user)
+        org = get_object_or_404(
+            Organization.objects.active(), id=org_id, members=request.user
+        )
 
         # B2B only + admin check
         if org.is_personal:
@@ -272,8 +294,7 @@ class OrganizationInviteCreateView(APIView):
             pass
 
         # Generate token for accept link
-        raw_token = f"{org.id}:{invited_email}:{timezone.now().timestamp()}"
-        token_hash = hashlib.sha256(raw_token.encode()).hexdigest()
+        token_hash = make_invite_token_hash(org, invited_email)
 
         # Revoke any existing pending invites to same email
         OrganizationInvite.objects.filter(
@@ -292,14 +313,10 @@ class OrganizationInviteCreateView(APIView):
             expires_at=timezone.now() + timedelta(days=7),
         )
 
-        # Send email - try async Celery task first, fall back to sync
+        # Send email via the outbox: published by the relay only after commit
         from apps.organizations.tasks import send_org_invite_email
 
-        try:
-            send_org_invite_email.delay(str(invite.id))
-        except Exception:
-            # Celery/Redis not available, send synchronously
-            send_org_invite_email(str(invite.id))
+        enqueue_task(send_org_invite_email, str(invite.id))
 
         # Create notification for inviter
         Notification.objects.create(
@@ -313,6 +330,136 @@ class OrganizationInviteCreateView(APIView):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
+class OrganizationBulkInviteCreateView(APIView):
+    """Invite many people at once (admin only, B2B only).
+
+    Body: ``{"invites": [{"invited_email": "...", "role": "member"}, ...]}``.
+    Existing users and memberships are resolved in set-based queries, invites
+    are inserted with one ``bulk_create`` and emails go out in batches on the
+    email queue through the outbox. Returns one result per submitted entry:
+    ``invited``, ``already_member``, ``duplicate`` or ``invalid``.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, org_id):
+        org = get_object_or_404(
+            Organization.objects.active(), id=org_id, members=request.user
+        )
+
+        if org.is_personal:
+            return Response(
+                {"error": "Invites not available for personal workspaces"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        membership = Membership.objects.get(user=request.user, organization=org)
+        if membership.role != Membership.ROLE_ADMIN:
+            return Response(
+                {"error": "Only admins can invite users"},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        envelope = BulkInviteSerializer(data=request.data)
+        envelope.is_valid(raise_exception=True)
+
+        # Validate entries individually so one bad address doesn't fail the batch
+        results = []
+        wanted = {}  # email -> (role, result index)
+        for item in envelope.validated_data["invites"]:
+            item_serializer = InviteSerializer(data=item)
+            if not item_serializer.is_valid():
+                results.append(
+                    {
+                        "invited_email": item.get("invited_email"),
+                        "status": "invalid",
+                        "errors": item_serializer.errors,
+                    }
+                )
+                continue
+            email = item_serializer.validated_data["invited_email"].lower()
+            role = item_serializer.validated_data.get(
+                "role", OrganizationInvite.ROLE_MEMBER
+            )
+            if email in wanted:
+                results.append({"invited_email": email, "status": "duplicate"})
+                continue
+            wanted[email] = (role, len(results))
+            results.append({"invited_email": email, "status": "invited"})
+
+        with transaction.atomic():
+            created, job_id = self._create_invites(request.user, org, wanted, results)
+
+        return Response(
+            {
+                "data": results,
+                "count": len(results),
+                "invited": len(created),
+                # Email delivery progress: GET /api/v1/tasks/<job_id>
+                "job_id": job_id,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+    def _create_invites(self, inviter, org, wanted, results):
+        if not wanted:
+            return [], None
+
+        # One query for every address that already belongs to the org
+        member_emails = set(
+            Membership.objects.filter(organization=org)
+            .annotate(email_lower=Lower("user__email"))
+            .filter(email_lower__in=wanted.keys())
+            .values_list("email_lower", flat=True)
+        )
+        for email in member_emails:
+            results[wanted.pop(email)[1]]["status"] = "already_member"
+        if not wanted:
+            return [], None
+
+        # Revoke any existing pending invites to the same addresses
+        OrganizationInvite.objects.filter(
+            organization=org,
+            invited_email__in=wanted.keys(),
+            status=OrganizationInvite.STATUS_PENDING,
+        ).update(status=OrganizationInvite.STATUS_REVOKED)
+
+        expires_at = timezone.now() + timedelta(days=7)
+        invites = OrganizationInvite.objects.bulk_create(
+            [
+                OrganizationInvite(
+                    organization=org,
+                    invited_email=email,
+                    invited_by=inviter,
+                    role=role,
+                    token_hash=make_invite_token_hash(org, email),
+                    expires_at=expires_at,
+                )
+                for email, (role, _index) in wanted.items()
+            ]
+        )
+        for invite in invites:
+            result = results[wanted[invite.invited_email][1]]
+            result["id"] = str(invite.id)
+            result["role"] = invite.role
+
+        # One summary notification instead of one per address
+        Notification.objects.create(
+            recipient=inviter,
+            type="invite_sent",
+            message=f"Invitations sent to {len(invites)} people",
+            target_url=f"/organizations/{org.id}/members",
+        )
+
+        from apps.organizations.tasks import enqueue_invite_emails
+
+        job_id = task_status.track_task(
+            inviter.id, total=len(invites), message="Sending invitation emails"
+        )
+        enqueue_invite_emails([invite.id for invite in invites], job_id=job_id)
+        return invites, job_id
+
+
 class OrganizationInviteAcceptView(APIView):
     """Accept an organization invite by token."""
 
@@ -320,7 +467,7 @@ class OrganizationInviteAcceptView(APIView):
 
     @transaction.atomic
     def post(self, request, org_id, token):
-        org = get_object_or_404(Organization, id=org_id)
+        org = get_object_or_404(Organization.objects.active(), id=org_id)
 
         # Token comes from URL path parameter
         token_hash = token.strip() if token else ""
@@ -396,7 +543,9 @@ class MembershipRoleUpdateView(APIView):
     permission_classes = [IsAuthenticated]
 
     def patch(self, request, org_id, membership_id):
-        org = get_object_or_404(Organization, id=org_id, members=request.user)
+        org = get_object_or_404(
+            Organization.objects.active(), id=org_id, members=request.user
+        )
 
         # Check admin role
         requester_membership = Membership.objects.get(
@@ -445,7 +594,9 @@ class MembershipRoleUpdateView(APIView):
 
     def delete(self, request, org_id, membership_id):
         """Remove a member from an organization (admin only)."""
-        org = get_object_or_404(Organization, id=org_id, members=request.user)
+        org = get_object_or_404(
+            Organization.objects.active(), id=org_id, members=request.user
+        )
 
         # Check admin role
         requester_membership = Membership.objects.get(
@@ -518,7 +669,9 @@ class OrganizationLeaveView(APIView):
 
     @transaction.atomic
     def post(self, request, org_id):
-        org = get_object_or_404(Organization, id=org_id, members=request.user)
+        org = get_object_or_404(
+            Organization.objects.active(), id=org_id, members=request.user
+        )
 
         # Get user's membership
         membership = get_object_or_404(
@@ -565,7 +718,9 @@ class OrganizationCloseView(APIView):
 
     @transaction.atomic
     def delete(self, request, org_id):
-        org = get_object_or_404(Organization, id=org_id, members=request.user)
+        org = get_object_or_404(
+            Organization.objects.active(), id=org_id, members=request.user
+        )
 
         # Only the owner can close the organization
         if request.user != org.owner:
@@ -592,6 +747,8 @@ class OrganizationCloseView(APIView):
             )
 
         org_name = org.name
+        org.deletion_requested_at = timezone.now()
+        org.save(update_fields=["deletion_requested_at"])
 
         # Clear current org for all members
         User = get_user_model()
@@ -599,23 +756,34 @@ class OrganizationCloseView(APIView):
         for user in users_to_update:
             # Find another org for each user or set to None
             other_membership = (
-                Membership.objects.filter(user=user).exclude(organization=org).first()
+                Membership.objects.filter(
+                    user=user, organization__deletion_requested_at__isnull=True
+                )
+                .exclude(organization=org)
+                .first()
             )
             user.current_organization = (
                 other_membership.organization if other_membership else None
             )
             user.save(update_fields=["current_organization"])
 
-        # Delete the organization (cascade will delete memberships, invites, etc.)
-        org.delete()
+        # Memberships, invites, etc. are deleted in chunks in the background
+        from apps.organizations.tasks import delete_organization
+
+        job_id = task_status.track_task(
+            request.user.id, message=f"Closing organization {org_name}"
+        )
+        enqueue_task(delete_organization, str(org.id), job_id=job_id)
 
         return Response(
             {
-                "message": f"Organization '{org_name}' has been closed",
+                "message": f"Organization '{org_name}' is being closed",
                 "data": {
                     "organization_name": org_name,
+                    "job_id": job_id,
                 },
-            }
+            },
+            status=status.HTTP_202_ACCEPTED,
         )
 
 
@@ -626,7 +794,9 @@ class OrganizationTransferOwnershipView(APIView):
 
     @transaction.atomic
     def post(self, request, org_id):
-        org = get_object_or_404(Organization, id=org_id, members=request.user)
+        org = get_object_or_404(
+            Organization.objects.active(), id=org_id, members=request.user
+        )
 
         # Only the owner can transfer ownership
         if request.user != org.owner:
@@ -747,7 +917,9 @@ class OrganizationInviteRevokeView(APIView):
 
     @transaction.atomic
     def delete(self, request, org_id, invite_id):
-        org = get_object_or_404(Organization, id=org_id, members=request.user)
+        org = get_object_or_404(
+            Organization.objects.active(), id=org_id, members=request.user
+        )
 
         # Check admin role
         membership = Membership.objects.get(user=request.user, organization=org)
@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import OutboxMessage
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ("id", "task_name", "created_at", "published_at", "attempts")
+    list_filter = ("task_name",)
+    search_fields = ("task_name", "last_error")
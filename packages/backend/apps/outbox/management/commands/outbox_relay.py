@@ -0,0 +1,52 @@
+import logging
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.outbox.relay import relay_batch
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Publish pending outbox messages to Celery (runs until stopped)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1.0,
+            help="Seconds to sleep when the outbox is empty.",
+        )
+        parser.add_argument(
+            "--once", action="store_true", help="Drain the outbox once and exit."
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        interval = options["interval"]
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        total = 0
+        while not self._stopping:
+            try:
+                published = relay_batch(batch_size)
+            except Exception:
+                # Database hiccup: log and keep the relay alive
+                logger.exception("Outbox relay batch failed")
+                published = 0
+            total += published
+            if options["once"] and published < batch_size:
+                break
+            # Keep draining while full batches come back; otherwise wait
+            if published < batch_size:
+                time.sleep(interval)
+
+        self.stdout.write(f"Outbox relay stopped after publishing {total} message(s)")
+
+    def _stop(self, *_args):
+        self._stopping = True
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-19 06:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("outbox", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="outboxmessage",
+            index=models.Index(
+                condition=models.Q(("published_at__isnull", False)),
+                fields=["published_at"],
+                name="outbox_published_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import uuid
+
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+
+
+class OutboxMessage(models.Model):
+    """A Celery task waiting to be published by the outbox relay.
+
+    Rows are written in the same transaction as the data the task depends on,
+    so a task is only ever published for committed data, and requests never
+    talk to the broker. The relay (``manage.py outbox_relay``) claims pending
+    rows with ``SELECT ... FOR UPDATE SKIP LOCKED`` and publishes them.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    task_name = models.CharField(max_length=255)
+    args = models.JSONField(default=list, blank=True)
+    kwargs = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Earliest time the relay may (re)try publishing; pushed back on failure
+    available_at = models.DateTimeField(default=timezone.now)
+    published_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ("created_at",)
+        indexes = [
+            # Only unpublished rows are scanned by the relay
+            models.Index(
+                fields=["available_at"],
+                condition=Q(published_at__isnull=True),
+                name="outbox_pending_idx",
+            ),
+            # Retention purge of published rows (apps.retention)
+            models.Index(
+                fields=["published_at"],
+                condition=Q(published_at__isnull=False),
+                name="outbox_published_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:  # pragma: no cover - representation only
+        status = "published" if self.published_at else "pending"
+        return f"OutboxMessage<{self.task_name}:{status}>"
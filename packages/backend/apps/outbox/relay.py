@@ -0,0 +1,94 @@
+"""Transactional outbox: enqueue Celery tasks with the data they depend on.
+
+Call ``enqueue_task`` inside the same ``transaction.atomic()`` block that writes
+the rows the task reads. Nothing touches the broker during the request; the
+relay publishes committed rows later. Rolled-back transactions leave no row,
+so no task fires for data that never existed.
+
+Delivery is at-least-once: if the relay dies after publishing but before its
+transaction commits, the batch is published again. Tasks must tolerate
+duplicates (they already skip invites that are no longer pending, etc.).
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from datetime import timedelta
+
+from celery import current_app
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for the retry backoff after failed publishes
+MAX_BACKOFF_SECONDS = 300
+
+
+def _task_name(task) -> str:
+    return task if isinstance(task, str) else task.name
+
+
+def enqueue_task(task, *args, **kwargs) -> OutboxMessage:
+    """Record a task invocation in the outbox (use instead of ``.delay()``)."""
+    return OutboxMessage.objects.create(
+        task_name=_task_name(task), args=list(args), kwargs=kwargs
+    )
+
+
+def enqueue_many(task, arg_lists: Iterable[Iterable]) -> list[OutboxMessage]:
+    """Record one invocation of ``task`` per argument list with one INSERT."""
+    name = _task_name(task)
+    return OutboxMessage.objects.bulk_create(
+        [OutboxMessage(task_name=name, args=list(args)) for args in arg_lists]
+    )
+
+
+def relay_batch(batch_size: int = 100) -> int:
+    """Claim and publish up to ``batch_size`` pending messages.
+
+    Rows are claimed with ``SKIP LOCKED`` so several relays can run side by side
+    without publishing the same row twice. Returns the number published.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        claimed = list(
+            OutboxMessage.objects.select_for_update(skip_locked=True)
+            .filter(published_at__isnull=True, available_at__lte=now)
+            .order_by("available_at")[:batch_size]
+        )
+        if not claimed:
+            return 0
+
+        published, failed = [], []
+        for message in claimed:
+            try:
+                current_app.send_task(
+                    message.task_name, args=message.args, kwargs=message.kwargs
+                )
+                published.append(message.id)
+            except Exception as e:
+                logger.warning(
+                    "Outbox publish failed for %s (%s): %s",
+                    message.id,
+                    message.task_name,
+                    e,
+                )
+                failed.append((message, str(e)))
+
+        if published:
+            OutboxMessage.objects.filter(id__in=published).update(
+                published_at=now, attempts=F("attempts") + 1
+            )
+        for message, error in failed:
+            backoff = min(2**message.attempts, MAX_BACKOFF_SECONDS)
+            OutboxMessage.objects.filter(id=message.id).update(
+                attempts=F("attempts") + 1,
+                available_at=now + timedelta(seconds=backoff),
+                last_error=error[:2000],
+            )
+    return len(published)
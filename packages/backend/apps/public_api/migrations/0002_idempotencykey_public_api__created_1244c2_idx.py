@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-19 06:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("public_api", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="idempotencykey",
+            index=models.Index(
+                fields=["created_at"], name="public_api__created_1244c2_idx"
+            ),
+        ),
+    ]
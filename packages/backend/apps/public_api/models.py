@@ -61,5 +61,7 @@ class IdempotencyKey(models.Model):
     class Meta:
         indexes = [
             models.Index(fields=["key", "path", "method"]),
+            # Retention purge (apps.retention)
+            models.Index(fields=["created_at"]),
         ]
         unique_together = ("key", "path", "method")
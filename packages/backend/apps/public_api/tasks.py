@@ -3,16 +3,21 @@ import time
 
 from celery import shared_task
 
+from boilerplate.task_status import report_progress
+
 logger = logging.getLogger(__name__)
 
 
-@shared_task
-def sample_background_task(user_email):
+@shared_task(bind=True)
+def sample_background_task(self, user_email):
     """
     A sample task that simulates a long-running process.
     """
     logger.info(f"Starting background task for user: {user_email}")
-    # Simulate work
-    time.sleep(5)
+    # Simulate work, reporting progress so clients can follow along
+    steps = 5
+    for step in range(steps):
+        time.sleep(1)
+        report_progress(self.request.id, step + 1, steps)
     logger.info(f"Finished background task for user: {user_email}")
     return f"Processed {user_email}"
@@ -7,11 +7,14 @@ from rest_framework_simplejwt.views import (
 
 from .views import (
     ActiveFeatureFlagsView,
+    DataExportDownloadView,
+    DataExportView,
     MagicLinkRequestView,
     MagicLinkVerifyView,
     MeView,
     PushRegisterView,
     RegisterView,
+    TaskStatusView,
     TriggerTaskView,
 )
 
@@ -19,6 +22,12 @@ app_name = "public_api"
 
 urlpatterns = [
     path("v1/me", MeView.as_view(), name="me"),
+    path("v1/me/export", DataExportView.as_view(), name="data-export"),
+    path(
+        "v1/me/export/<uuid:job_id>",
+        DataExportDownloadView.as_view(),
+        name="data-export-download",
+    ),
     path("auth/register/", RegisterView.as_view(), name="register"),
     path("push/register/", PushRegisterView.as_view(), name="push-register"),
     path("features/", ActiveFeatureFlagsView.as_view(), name="featureflags-active"),
@@ -30,6 +39,7 @@ urlpatterns = [
     path("auth/jwt/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
     path("auth/jwt/verify/", TokenVerifyView.as_view(), name="token_verify"),
     path("v1/trigger-task", TriggerTaskView.as_view(), name="trigger-task"),
+    path("v1/tasks/<str:task_id>", TaskStatusView.as_view(), name="task-status"),
     # Organizations
     path("v1/organizations/", include("apps.organizations.urls")),
 ]
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import json
+import time
+
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.http import FileResponse, StreamingHttpResponse
 from rest_framework import serializers, status
+from rest_framework.exceptions import NotFound, Throttled
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.throttling import AnonRateThrottle
@@ -12,13 +17,23 @@ from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.featureflags.models import FeatureFlag
 from apps.notifications.models import DeviceToken
-from apps.organizations.models import Membership, Organization
+from apps.organizations.models import Organization
 from apps.public_api.tasks import sample_background_task
 from apps.users.magic_link import (
     create_magic_link,
-    send_magic_link,
+    queue_magic_link,
     verify_magic_link,
 )
+from apps.users.magic_link_limits import (
+    claim_pending,
+    record_verify_failure,
+    release_pending,
+    remember_pending,
+    reset_verify_failures,
+    verify_blocked,
+)
+from apps.users.provisioning import create_personal_organization, provision_user
+from boilerplate import task_status
 
 
 def serialize_organization(org: Organization | None) -> dict | None:
@@ -46,35 +61,6 @@ def serialize_user_with_org(user) -> dict:
     }
 
 
-def create_personal_organization(user) -> Organization:
-    """Create a personal workspace organization for a user (B2C mode).
-
-    Creates the organization, adds the user as admin member, and sets it
-    as their current organization.
-    """
-    # Build workspace name from user's name or email
-    if user.first_name:
-        workspace_name = f"{user.first_name}'s Workspace"
-    else:
-        # Use email prefix if no first name
-        email_prefix = user.email.split("@")[0]
-        workspace_name = f"{email_prefix}'s Workspace"
-
-    org = Organization.objects.create(
-        name=workspace_name,
-        owner=user,
-        is_personal=True,
-    )
-    Membership.objects.create(
-        user=user,
-        organization=org,
-        role=Membership.ROLE_ADMIN,
-    )
-    user.current_organization = org
-    user.save(update_fields=["current_organization"])
-    return org
-
-
 class MeView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -106,6 +92,57 @@ class MeView(APIView):
         return Response({"message": "Profile updated successfully"})
 
 
+class DataExportView(APIView):
+    """Start an export of the current user's data (gzip NDJSON archive).
+
+    Returns a job id; follow progress at ``/api/v1/tasks/<job_id>`` and
+    download from ``/api/v1/me/export/<job_id>`` once it has succeeded.
+    """
+
+    permission_classes = [IsAuthenticated]
+    throttle_scope = "data_export"
+
+    def post(self, request):
+        from apps.outbox.relay import enqueue_task
+        from apps.users.tasks import export_user_data
+
+        job_id = task_status.track_task(
+            request.user.id, total=6, message="Data export queued"
+        )
+        enqueue_task(export_user_data, str(request.user.id), job_id)
+        return Response(
+            {
+                "data": {
+                    "job_id": job_id,
+                    "status_url": f"/api/v1/tasks/{job_id}",
+                    "download_url": f"/api/v1/me/export/{job_id}",
+                }
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
+
+
+class DataExportDownloadView(APIView):
+    """Stream a finished export archive from storage (never loaded in memory)."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, job_id):
+        from apps.users.export import export_name, get_storage
+
+        storage = get_storage()
+        # The name embeds the requesting user's id, so other users' jobs 404
+        name = export_name(request.user.id, job_id)
+        if not storage.exists(name):
+            raise NotFound("Export not found or not ready yet")
+        return FileResponse(
+            storage.open(name, "rb"),
+            as_attachment=True,
+            filename=f"data-export-{job_id}.ndjson.gz",
+            content_type="application/gzip",
+        )
+
+
 class TriggerTaskView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -113,13 +150,85 @@ class TriggerTaskView(APIView):
         """
         Trigger a background task for the logged-in user.
         """
-        task = sample_background_task.delay(request.user.email)
+        task_id = task_status.track_task(request.user.id, message="Sample task")
+        sample_background_task.apply_async(args=[request.user.email], task_id=task_id)
         return Response(
-            {"message": "Task triggered successfully", "task_id": task.id},
+            {"message": "Task triggered successfully", "task_id": task_id},
             status=status.HTTP_202_ACCEPTED,
         )
 
 
+def _public_status(data: dict) -> dict:
+    return {k: v for k, v in data.items() if k != "user"}
+
+
+class TaskStatusView(APIView):
+    """Status and progress of a background job started by the current user.
+
+    Long-poll: pass ``version`` (last version seen) and ``wait`` (seconds, max
+    25) to block until the job changes instead of polling in a tight loop.
+    Server-sent events: send ``Accept: text/event-stream`` (or ``?stream=1``)
+    to receive every change until the job finishes.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    MAX_WAIT_SECONDS = 25
+    MAX_STREAM_SECONDS = 300
+    KEEPALIVE_SECONDS = 15
+
+    def perform_content_negotiation(self, request, force=False):
+        # EventSource clients send Accept: text/event-stream; don't 406 them
+        return super().perform_content_negotiation(request, force=True)
+
+    def get(self, request, task_id):
+        current = task_status.get_status(task_id)
+        if current is None or current.get("user") != str(request.user.id):
+            raise NotFound("Task not found")
+
+        if (
+            "text/event-stream" in request.headers.get("Accept", "")
+            or request.query_params.get("stream") == "1"
+        ):
+            return self._stream(task_id)
+
+        try:
+            version = int(request.query_params.get("version", 0))
+            wait = float(request.query_params.get("wait", 0))
+        except ValueError:
+            return Response(
+                {"error": "version and wait must be numbers"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        wait = max(0.0, min(wait, self.MAX_WAIT_SECONDS))
+        current = task_status.wait_for_change(task_id, version, wait) or current
+        return Response({"data": _public_status(current)})
+
+    def _stream(self, task_id):
+        def events():
+            version = 0
+            deadline = time.monotonic() + self.MAX_STREAM_SECONDS
+            while (remaining := deadline - time.monotonic()) > 0:
+                current = task_status.wait_for_change(
+                    task_id, version, min(self.KEEPALIVE_SECONDS, remaining)
+                )
+                if current is None:
+                    yield "event: expired\ndata: {}\n\n"
+                    return
+                if current["version"] > version:
+                    version = current["version"]
+                    yield f"data: {json.dumps(_public_status(current))}\n\n"
+                else:
+                    yield ": keepalive\n\n"
+                if current["state"] in task_status.TERMINAL_STATES:
+                    return
+
+        response = StreamingHttpResponse(events(), content_type="text/event-stream")
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
 User = get_user_model()
 
 
@@ -158,7 +267,7 @@ class RegisterSerializer(serializers.Serializer):
         return value
 
     def create(self, validated_data):
-        return User.objects.create_user(
+        return provision_user(
             email=validated_data["email"],
             password=validated_data["password"],
             first_name=validated_data.get("first_name", ""),
@@ -174,14 +283,9 @@ class RegisterView(APIView):
     def post(self, request):
         serializer = RegisterSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
+        # B2C mode: the personal workspace is created along with the user
         user = serializer.save()
 
-        # B2C mode: auto-create personal workspace
-        if settings.APP_MODE == "b2c":
-            create_personal_organization(user)
-            # Refresh user to get current_organization
-            user.refresh_from_db()
-
         # Issue JWT tokens
         refresh = RefreshToken.for_user(user)
         data = {
@@ -240,6 +344,8 @@ class MagicLinkRequestSerializer(serializers.Serializer):
 class MagicLinkVerifySerializer(serializers.Serializer):
     # 8-digit numeric code generated by magic link flow.
     token = serializers.CharField(min_length=8, max_length=8, write_only=True)
+    # Optional: binds the code to an address and enables per-email attempt limits
+    email = serializers.EmailField(required=False)
 
     def validate_token(self, value: str) -> str:
         v = value.strip()
@@ -252,6 +358,8 @@ class MagicLinkRequestView(APIView):
     """Request a magic link for passwordless auth.
 
     Always returns 202 even if email does not correspond to an existing user.
+    Repeat requests within MAGIC_LINK_COALESCE_SECONDS reuse the pending code
+    (no new row, no new email).
     In DEBUG (and when MAGIC_LINK_DEBUG_ECHO_TOKEN is True) the raw token is echoed
     for local development/testing convenience.
     """
@@ -263,39 +371,72 @@ class MagicLinkRequestView(APIView):
         ser = MagicLinkRequestSerializer(data=request.data)
         ser.is_valid(raise_exception=True)
         email = ser.validated_data["email"].strip()
+        echo = settings.DEBUG and getattr(
+            settings, "MAGIC_LINK_DEBUG_ECHO_TOKEN", False
+        )
+        resp = {"status": "accepted"}
+
+        claimed, pending_token = claim_pending(email)
+        if not claimed:
+            if echo and pending_token:
+                resp["debug_token"] = pending_token
+            return Response(resp, status=status.HTTP_202_ACCEPTED)
+
         ip = request.META.get("REMOTE_ADDR", "")
         ua = request.META.get("HTTP_USER_AGENT", "")
-        created = create_magic_link(email, ip=ip, user_agent=ua)
-        # Pass request for fallback URL building if MAGIC_LINK_VERIFY_URL not set
-        send_magic_link(created.record, created.raw_token, request=request)
-        resp = {"status": "accepted"}
-        if settings.DEBUG and getattr(settings, "MAGIC_LINK_DEBUG_ECHO_TOKEN", False):
+        try:
+            with transaction.atomic():
+                created = create_magic_link(email, ip=ip, user_agent=ua)
+                # Email is rendered and sent by a Celery task after commit
+                queue_magic_link(created.record, created.raw_token)
+        except Exception:
+            release_pending(email)
+            raise
+        remember_pending(email, created.raw_token if echo else None)
+        if echo:
             resp["debug_token"] = created.raw_token
         return Response(resp, status=status.HTTP_202_ACCEPTED)
 
 
 class MagicLinkVerifyView(APIView):
-    """Verify a magic link token and issue JWT tokens."""
+    """Verify a magic link token and issue JWT tokens.
+
+    Failed attempts are counted per client IP (and per email when supplied);
+    once over the limit requests get 429 from the cache before any row lock.
+    """
 
     permission_classes = [AllowAny]
     throttle_classes = [AnonRateThrottle]
 
-    @transaction.atomic
     def post(self, request):
         ser = MagicLinkVerifySerializer(data=request.data)
         ser.is_valid(raise_exception=True)
         token = ser.validated_data["token"].strip()
-        user = verify_magic_link(token)
-        if not user:
+        email = ser.validated_data.get("email") or None
+        ip = request.META.get("REMOTE_ADDR", "")
+
+        retry_after = verify_blocked(ip, email)
+        if retry_after is not None:
+            raise Throttled(wait=retry_after)
+
+        with transaction.atomic():
+            return self._verify(token, email, ip)
+
+    def _verify(self, token, email, ip):
+        user = verify_magic_link(token, email=email)
+        # Deactivated accounts (e.g. pending deletion) cannot sign in
+        if not user or not user.is_active:
+            record_verify_failure(ip, email)
             return Response(
                 {"error": "invalid_or_expired"}, status=status.HTTP_400_BAD_REQUEST
             )
+        release_pending(user.email)
+        reset_verify_failures(email)
 
-        # B2C mode: ensure user has a personal workspace
-        # (handles both new users created via magic link and existing users without orgs)
+        # B2C mode: users created by the magic link already have a personal
+        # workspace; existing users without one get it now
         if settings.APP_MODE == "b2c" and user.current_organization is None:
             create_personal_organization(user)
-            user.refresh_from_db()
 
         refresh = RefreshToken.for_user(user)
         data = {
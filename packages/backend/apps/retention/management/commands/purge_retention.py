@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.retention.policies import POLICIES, get_policy
+from apps.retention.purge import purge
+
+
+class Command(BaseCommand):
+    help = "Delete rows outside their retention policy (same as the beat job)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "policies", nargs="*", help="Policy names (default: all policies)."
+        )
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument(
+            "--sleep", type=float, default=None, help="Seconds between batches."
+        )
+        parser.add_argument(
+            "--list", action="store_true", help="List policies and exit."
+        )
+
+    def handle(self, *args, **options):
+        if options["list"]:
+            for policy in POLICIES:
+                self.stdout.write(
+                    f"{policy.name}: {policy.model}.{policy.field} "
+                    f"older than {policy.keep_for().days} day(s)"
+                )
+            return
+
+        try:
+            policies = [get_policy(n) for n in options["policies"]] or POLICIES
+        except KeyError as e:
+            raise CommandError(str(e)) from e
+
+        for policy in policies:
+            deleted = purge(
+                policy, batch_size=options["batch_size"], sleep=options["sleep"]
+            )
+            self.stdout.write(f"{policy.name}: purged {deleted} row(s)")
@@ -0,0 +1,17 @@
+from prometheus_client import Counter, Gauge
+
+ROWS_PURGED = Counter(
+    "retention_rows_purged_total",
+    "Rows deleted by the retention engine",
+    ["policy"],
+)
+BATCHES = Counter(
+    "retention_batches_total",
+    "Delete batches executed by the retention engine",
+    ["policy"],
+)
+LAST_RUN = Gauge(
+    "retention_last_run_timestamp_seconds",
+    "Unix time the policy last finished a purge run",
+    ["policy"],
+)
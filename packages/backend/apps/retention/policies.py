@@ -0,0 +1,91 @@
+"""Retention policies: how long rows of each ephemeral table are kept.
+
+A policy names a model, the timestamp column compared against the cutoff
+(``now - keep``) and an indexed ordering used to pick each delete batch.
+Keep periods can be overridden per policy with ``RETENTION_KEEP_DAYS``
+(e.g. ``admin_audit=730,notifications=14``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import QuerySet
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    name: str
+    model: str  # "app_label.ModelName"
+    field: str  # rows with field < now - keep are purged
+    keep: timedelta
+    # Indexed column batches are taken in; defaults to ``field``. Tables without
+    # an index on ``field`` scan their monotonic primary key instead.
+    order_by: str | None = None
+    filters: dict = field(default_factory=dict)
+    exclude: dict = field(default_factory=dict)
+
+    def keep_for(self) -> timedelta:
+        overrides = getattr(settings, "RETENTION_KEEP_DAYS", {}) or {}
+        if self.name in overrides:
+            return timedelta(days=int(overrides[self.name]))
+        return self.keep
+
+    def expired(self, now: datetime) -> QuerySet:
+        model = apps.get_model(self.model)
+        cutoff = now - self.keep_for()
+        qs = model._default_manager.filter(
+            **{f"{self.field}__lt": cutoff}, **self.filters
+        )
+        if self.exclude:
+            qs = qs.exclude(**self.exclude)
+        return qs.order_by(self.order_by or self.field)
+
+
+POLICIES = [
+    # Links are single use and expire within minutes; a day covers support lookups
+    RetentionPolicy("magic_links", "users.MagicLink", "expires_at", timedelta(days=1)),
+    # Replays only matter while clients may still retry
+    RetentionPolicy(
+        "idempotency_keys", "public_api.IdempotencyKey", "created_at", timedelta(days=2)
+    ),
+    # Accepted invites are membership history and are kept
+    RetentionPolicy(
+        "org_invites",
+        "organizations.OrganizationInvite",
+        "expires_at",
+        timedelta(days=30),
+        exclude={"status": "accepted"},
+    ),
+    RetentionPolicy(
+        "admin_audit", "admin_api.AdminAudit", "created_at", timedelta(days=365)
+    ),
+    # Only read notifications; unread ones stay until the user sees them
+    RetentionPolicy(
+        "notifications", "notifications.Notification", "read_at", timedelta(days=30)
+    ),
+    # simplejwt has no index on expires_at; ids grow with issue time
+    RetentionPolicy(
+        "jwt_outstanding_tokens",
+        "token_blacklist.OutstandingToken",
+        "expires_at",
+        timedelta(days=0),
+        order_by="id",
+    ),
+    RetentionPolicy(
+        "outbox_published",
+        "outbox.OutboxMessage",
+        "published_at",
+        timedelta(days=7),
+    ),
+]
+
+
+def get_policy(name: str) -> RetentionPolicy:
+    for policy in POLICIES:
+        if policy.name == name:
+            return policy
+    raise KeyError(f"Unknown retention policy: {name}")
@@ -0,0 +1,82 @@
+"""Batched purge of rows that fall outside their retention policy.
+
+Each batch selects at most ``RETENTION_BATCH_SIZE`` primary keys along the
+policy's indexed ordering and deletes them in a short transaction of its own,
+then sleeps ``RETENTION_BATCH_SLEEP_SECONDS`` so replication and hot writers
+keep up. On PostgreSQL every batch sets a ``lock_timeout``: a batch that
+would queue behind (and in turn block) application writes gives up and the
+run ends; the next scheduled run continues where this one stopped.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.db import OperationalError, connection, transaction
+from django.utils import timezone
+
+from apps.retention.metrics import BATCHES, LAST_RUN, ROWS_PURGED
+from apps.retention.policies import RetentionPolicy
+
+logger = logging.getLogger(__name__)
+
+
+def _set_lock_timeout() -> None:
+    if connection.vendor == "postgresql":
+        timeout_ms = int(getattr(settings, "RETENTION_LOCK_TIMEOUT_MS", 2000))
+        with connection.cursor() as cursor:
+            cursor.execute(f"SET LOCAL lock_timeout = {timeout_ms}")
+
+
+def purge(
+    policy: RetentionPolicy,
+    *,
+    batch_size: int | None = None,
+    sleep: float | None = None,
+    max_seconds: float | None = None,
+    now=None,
+) -> int:
+    """Delete expired rows for ``policy``; returns the number of rows removed.
+
+    Stops when nothing is left, a batch hits the lock timeout, or the run has
+    taken ``max_seconds`` (``RETENTION_MAX_SECONDS_PER_RUN``).
+    """
+    if batch_size is None:
+        batch_size = settings.RETENTION_BATCH_SIZE
+    if sleep is None:
+        sleep = settings.RETENTION_BATCH_SLEEP_SECONDS
+    if max_seconds is None:
+        max_seconds = settings.RETENTION_MAX_SECONDS_PER_RUN
+    # One cutoff for the whole run so batches don't chase a moving target
+    now = now or timezone.now()
+    label = apps.get_model(policy.model)._meta.label
+    deadline = time.monotonic() + max_seconds
+
+    total = 0
+    while True:
+        ids = list(policy.expired(now).values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            break
+        try:
+            with transaction.atomic():
+                _set_lock_timeout()
+                # Re-apply the policy filter in case a row changed since the select
+                _, per_model = policy.expired(now).filter(pk__in=ids).delete()
+        except OperationalError as e:
+            logger.warning(f"Retention {policy.name}: batch gave up on locks: {e}")
+            break
+        deleted = per_model.get(label, 0)
+        total += deleted
+        ROWS_PURGED.labels(policy.name).inc(deleted)
+        BATCHES.labels(policy.name).inc()
+        if len(ids) < batch_size or time.monotonic() >= deadline:
+            break
+        if sleep:
+            time.sleep(sleep)
+
+    LAST_RUN.labels(policy.name).set_to_current_time()
+    logger.info(f"Retention {policy.name}: purged {total} row(s)")
+    return total
@@ -0,0 +1,27 @@
+import logging
+
+from celery import shared_task
+
+from apps.retention.policies import POLICIES, get_policy
+from apps.retention.purge import purge
+from boilerplate.dedup import DeduplicatedTask
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def run_retention():
+    """Beat entry point: fan out one purge task per policy."""
+    for policy in POLICIES:
+        purge_retention_policy.delay(policy.name)
+
+
+# The lock keeps two runs of the same policy from deleting side by side
+@shared_task(base=DeduplicatedTask, ignore_result=True, dedup_done_ttl=60)
+def purge_retention_policy(policy_name):
+    try:
+        policy = get_policy(policy_name)
+    except KeyError:
+        logger.error(f"Unknown retention policy {policy_name}")
+        return 0
+    return purge(policy)
@@ -0,0 +1,161 @@
+"""Bulk user import from CSV or NDJSON.
+
+Rows have ``email`` and optionally ``first_name``, ``last_name`` and
+``password``. A password must already be hashed in a format one of the
+configured ``PASSWORD_HASHERS`` understands (for example exported from
+another Django install); rows without a password get an unusable one and sign
+in by magic link. Nothing is hashed during the import.
+
+Input is read line by line and written in batches of
+``USER_IMPORT_BATCH_SIZE``; each batch is one transaction with a fixed number
+of statements (existing-email lookup, user insert, and in B2C mode the
+personal organization, membership and ``current_organization`` writes from
+``apps.users.provisioning``), regardless of the batch size. Existing emails
+are skipped, so an interrupted import can simply be run again.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+
+from apps.users.provisioning import bulk_provision_personal_orgs
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("csv", "ndjson")
+MAX_REPORTED_ERRORS = 100
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def error(self, line: int, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "error": message})
+
+    def as_dict(self) -> dict:
+        return {
+            "created": self.created,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "errors": self.errors,
+        }
+
+
+def _text_lines(lines: Iterable[bytes | str]) -> Iterator[str]:
+    for line in lines:
+        yield line.decode("utf-8-sig") if isinstance(line, bytes) else line
+
+
+def parse_rows(lines: Iterable[bytes | str], fmt: str) -> Iterator[tuple[int, dict]]:
+    """Yield ``(line number, row)`` pairs; unparseable rows yield ``row=None``."""
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    text = _text_lines(lines)
+    if fmt == "csv":
+        reader = csv.DictReader(text)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield number, row if isinstance(row, dict) else None
+
+
+def _build_user(row: dict):
+    User = get_user_model()
+    email = User.objects.normalize_email((row.get("email") or "").strip())
+    validate_email(email)
+    password = (row.get("password") or "").strip()
+    if password:
+        # Raises ValueError for plain text or unknown algorithms
+        identify_hasher(password)
+    else:
+        password = make_password(None)
+    return User(
+        email=email,
+        first_name=(row.get("first_name") or "").strip()[:150],
+        last_name=(row.get("last_name") or "").strip()[:150],
+        password=password,
+    )
+
+
+def _write_batch(users: list, result: ImportResult) -> None:
+    User = get_user_model()
+    with transaction.atomic():
+        existing = set(
+            User.objects.filter(email__in=[u.email for u in users]).values_list(
+                "email", flat=True
+            )
+        )
+        new = [u for u in users if u.email not in existing]
+        result.skipped += len(users) - len(new)
+        if not new:
+            return
+        User.objects.bulk_create(new)
+        if settings.APP_MODE == "b2c":
+            bulk_provision_personal_orgs(new)
+        result.created += len(new)
+
+
+def import_users(
+    rows: Iterable[tuple[int, dict | None]],
+    *,
+    batch_size: int | None = None,
+) -> ImportResult:
+    """Create users from parsed ``rows``; see the module docstring."""
+    batch_size = batch_size or int(getattr(settings, "USER_IMPORT_BATCH_SIZE", 500))
+    result = ImportResult()
+    batch: list = []
+    # Duplicates across batches are caught by the existing-email lookup
+    emails_in_batch: set[str] = set()
+
+    def flush():
+        _write_batch(batch, result)
+        batch.clear()
+        emails_in_batch.clear()
+
+    for line, row in rows:
+        if row is None:
+            result.error(line, "unparseable row")
+            continue
+        try:
+            user = _build_user(row)
+        except (ValidationError, ValueError):
+            result.error(line, "invalid email or password hash")
+            continue
+        if user.email in emails_in_batch:
+            result.skipped += 1
+            continue
+        emails_in_batch.add(user.email)
+        batch.append(user)
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    logger.info(
+        f"User import: {result.created} created, {result.skipped} skipped, "
+        f"{result.failed} failed"
+    )
+    return result
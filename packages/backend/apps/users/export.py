@@ -0,0 +1,153 @@
+"""Per-user data export (profile, memberships, organizations, notifications,
+device tokens and invites) as gzip-compressed NDJSON.
+
+Each line is ``{"type": <section>, "data": {...}}``. Sections are streamed
+from ``QuerySet.values().iterator()`` into a gzip temp file and then copied
+to the ``exports`` storage (local disk by default, any Django storage such
+as S3 via ``STORAGES["exports"]``), so memory use does not grow with the
+size of the account.
+
+Archives live at ``<user id>/<job id>.ndjson.gz``. The path contains the user
+id, which keeps downloads scoped to their owner, and old archives are removed
+by ``purge_expired_exports``.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import tempfile
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import storages
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.notifications.models import DeviceToken, Notification
+from apps.organizations.models import Membership, Organization, OrganizationInvite
+from boilerplate import task_status
+
+logger = logging.getLogger(__name__)
+
+ITERATOR_CHUNK_SIZE = 500
+
+
+def get_storage():
+    return storages["exports"]
+
+
+def export_name(user_id, job_id) -> str:
+    return f"{user_id}/{job_id}.ndjson.gz"
+
+
+def _sections(user):
+    """Yield ``(section, queryset)`` pairs; querysets are evaluated lazily."""
+    User = type(user)
+    yield (
+        "profile",
+        User.objects.filter(pk=user.pk).values(
+            "id",
+            "email",
+            "first_name",
+            "last_name",
+            "date_joined",
+            "last_login",
+            "current_organization_id",
+        ),
+    )
+    yield (
+        "membership",
+        Membership.objects.filter(user=user)
+        .order_by("created_at")
+        .values("id", "organization_id", "role", "created_at"),
+    )
+    yield (
+        "organization",
+        Organization.objects.filter(membership__user=user)
+        .order_by("created_at")
+        .values("id", "name", "is_personal", "owner_id", "created_at"),
+    )
+    yield (
+        "notification",
+        Notification.objects.filter(recipient=user)
+        .order_by("created_at")
+        .values("id", "type", "message", "target_url", "read_at", "created_at"),
+    )
+    yield (
+        "device_token",
+        DeviceToken.objects.filter(user=user)
+        .order_by("created_at")
+        .values("id", "platform", "user_agent", "created_at", "updated_at"),
+    )
+    yield (
+        "invite",
+        OrganizationInvite.objects.filter(
+            Q(invited_email__iexact=user.email)
+            | Q(invited_by=user)
+            | Q(accepted_by=user)
+        )
+        .order_by("created_at")
+        # token_hash is a credential and is left out
+        .values(
+            "id",
+            "organization_id",
+            "invited_email",
+            "invited_by_id",
+            "accepted_by_id",
+            "role",
+            "status",
+            "created_at",
+            "expires_at",
+            "accepted_at",
+            "declined_at",
+        ),
+    )
+
+
+SECTION_COUNT = 6
+
+
+def build_export(user, job_id: str) -> str:
+    """Write the archive for ``user`` and return its storage name."""
+    rows = 0
+    with tempfile.TemporaryFile() as tmp:
+        with gzip.GzipFile(fileobj=tmp, mode="wb") as gz:
+            for done, (section, queryset) in enumerate(_sections(user), start=1):
+                for row in queryset.iterator(chunk_size=ITERATOR_CHUNK_SIZE):
+                    line = json.dumps(
+                        {"type": section, "data": row}, cls=DjangoJSONEncoder
+                    )
+                    gz.write(line.encode("utf-8") + b"\n")
+                    rows += 1
+                task_status.report_progress(
+                    job_id, done, SECTION_COUNT, message=f"Exported {section}"
+                )
+        tmp.seek(0)
+        name = get_storage().save(export_name(user.pk, job_id), File(tmp))
+    logger.info(f"Data export {job_id} for user {user.pk}: {rows} row(s)")
+    return name
+
+
+def purge_expired_exports() -> int:
+    """Delete archives older than ``DATA_EXPORT_TTL_HOURS``; returns the count."""
+    storage = get_storage()
+    cutoff = timezone.now() - timedelta(
+        hours=int(getattr(settings, "DATA_EXPORT_TTL_HOURS", 72))
+    )
+    removed = 0
+    try:
+        user_dirs, _files = storage.listdir("")
+    except FileNotFoundError:
+        return 0
+    for user_dir in user_dirs:
+        _dirs, files = storage.listdir(user_dir)
+        for filename in files:
+            name = f"{user_dir}/{filename}"
+            if storage.get_modified_time(name) < cutoff:
+                storage.delete(name)
+                removed += 1
+    return removed
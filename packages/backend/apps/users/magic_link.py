@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 import hashlib
+import logging
 import secrets
 from dataclasses import dataclass
 from datetime import timedelta
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.mail import send_mail
-from django.template.loader import render_to_string
+from django.db import transaction
 from django.utils import timezone
 
+from boilerplate.mail import render_cached, send_email
+
 from .models import MagicLink
+from .provisioning import provision_user
+
+logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
@@ -69,8 +74,8 @@ def create_magic_link(
     return CreatedMagicLink(raw_token=raw_token, record=record)
 
 
-def send_magic_link(record: MagicLink, raw_token: str, *, request=None) -> None:
-    """Send the magic link email (short code) via configured backend.
+def build_verify_url(raw_token: str) -> str:
+    """Return the frontend verify URL for a code.
 
     Requires MAGIC_LINK_VERIFY_URL to be set to the frontend route that handles verification.
     We avoid backend URL fallback to prevent user confusion.
@@ -88,16 +93,24 @@ def send_magic_link(record: MagicLink, raw_token: str, *, request=None) -> None:
     # Always prefer path param style for consistency with Flutter web route matching.
     base_clean = verify_base.rstrip("/")
     if base_clean.endswith("magic-verify"):
-        verify_url = f"{base_clean}/{raw_token}"
-    else:
-        verify_url = f"{base_clean}/magic-verify/{raw_token}"
+        return f"{base_clean}/{raw_token}"
+    return f"{base_clean}/magic-verify/{raw_token}"
+
+
+def send_magic_link(email: str, raw_token: str) -> None:
+    """Send the magic link email (short code) via configured backend.
+
+    Runs inside the ``send_magic_link_email`` Celery task; uses the worker's
+    pooled email connection and the cached compiled template.
+    """
+    verify_url = build_verify_url(raw_token)
     subject = "Your sign-in link"
     text_body = (
         f"Hello,\n\nYour sign-in code is: {raw_token}\n"
         f"Or click to sign in: {verify_url}\n\n"
         f"Code/link expire in {settings.MAGIC_LINK_EXPIRY_MINUTES} minute(s) or after first use."
     )
-    html_body = render_to_string(
+    html_body = render_cached(
         "users/magic_link_email.html",
         {
             "raw_token": raw_token,
@@ -105,36 +118,54 @@ def send_magic_link(record: MagicLink, raw_token: str, *, request=None) -> None:
             "expiry_minutes": settings.MAGIC_LINK_EXPIRY_MINUTES,
         },
     )
+    send_email(subject, text_body, [email], html_body=html_body)
 
-    send_mail(
-        subject,
-        text_body,
-        getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@example.local"),
-        [record.email],
-        html_message=html_body,
-        fail_silently=True,  # avoid raising dev errors if mail server absent
-    )
+
+def queue_magic_link(record: MagicLink, raw_token: str) -> None:
+    """Schedule delivery of the magic link email once the transaction commits.
+
+    The verify URL is validated here so misconfiguration still fails the request
+    instead of surfacing only in worker logs.
+    """
+    from .tasks import send_magic_link_email
+
+    build_verify_url(raw_token)
+    email = record.email
+
+    def _dispatch() -> None:
+        try:
+            send_magic_link_email.delay(email, raw_token)
+        except Exception:
+            # Celery/Redis not available, send synchronously
+            logger.warning("Broker unavailable, sending magic link inline")
+            send_magic_link(email, raw_token)
+
+    transaction.on_commit(_dispatch)
 
 
-def verify_magic_link(raw_token: str) -> User | None:
+def verify_magic_link(raw_token: str, *, email: str | None = None) -> User | None:
     """Verify a raw token, mark record used, and return the associated user.
 
     If no user existed at creation time, create a new one now (signup-on-first-use).
+    When ``email`` is given the code must also belong to that address.
     Returns None if token invalid/expired/used.
     """
     token_hash = _hash_token(raw_token)
     now = timezone.now()
-    ml = (
-        MagicLink.objects.select_for_update()
+    qs = (
+        MagicLink.objects.select_for_update(of=("self",))
+        .select_related("user__current_organization")
         .filter(token_hash=token_hash, used_at__isnull=True, expires_at__gt=now)
-        .first()
     )
+    if email:
+        qs = qs.filter(email__iexact=email.strip())
+    ml = qs.first()
     if not ml:
         return None
     # Resolve user (create lazily if needed) BEFORE deleting record
     user = ml.user
     if not user:
-        user = User.objects.create_user(email=ml.email, password=None)
+        user = provision_user(ml.email)
     # Hard delete for single-use cleanup (reduces table size, removes hash)
     ml.delete()
     return user
@@ -0,0 +1,124 @@
+"""Cache-backed guards for the magic link endpoints.
+
+- Request coalescing: repeated requests for the same email within
+  ``MAGIC_LINK_COALESCE_SECONDS`` reuse the pending code instead of inserting a
+  new ``MagicLink`` row and sending another email.
+- Verify failure counters: failed verifications are counted per client IP and
+  (when the client sends it) per email. Once a limit is reached, further
+  attempts are rejected from the cache without touching the database.
+
+Counters live in the default Django cache; configure ``REDIS_URL`` (Redis) so
+they are shared across processes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+
+_COALESCE_PREFIX = "magiclink:pending:"
+_FAIL_IP_PREFIX = "magiclink:fail:ip:"
+_FAIL_EMAIL_PREFIX = "magiclink:fail:email:"
+
+# Stored when the raw code must not be kept (debug echo disabled)
+_PENDING_MARKER = "1"
+
+
+def _email_key(email: str) -> str:
+    # Hash so raw addresses never appear in cache keys
+    return hashlib.sha256(email.strip().lower().encode("utf-8")).hexdigest()
+
+
+def _coalesce_seconds() -> int:
+    window = int(getattr(settings, "MAGIC_LINK_COALESCE_SECONDS", 0))
+    # Never coalesce past the lifetime of the code itself
+    return min(window, int(settings.MAGIC_LINK_EXPIRY_MINUTES) * 60)
+
+
+def _failure_window() -> int:
+    return int(getattr(settings, "MAGIC_LINK_VERIFY_FAILURE_WINDOW_SECONDS", 900))
+
+
+def claim_pending(email: str) -> tuple[bool, str | None]:
+    """Atomically claim the coalescing slot for ``email``.
+
+    Returns ``(True, None)`` when the caller should mint and send a new code and
+    ``(False, cached_token)`` when a code was issued within the window. The
+    cached token is only available when debug echo is enabled (see
+    ``remember_pending``); otherwise only a marker is stored so raw codes never
+    sit in the cache.
+    """
+    window = _coalesce_seconds()
+    if window <= 0:
+        return True, None
+    key = _COALESCE_PREFIX + _email_key(email)
+    if cache.add(key, _PENDING_MARKER, timeout=window):
+        return True, None
+    existing = cache.get(key)
+    return False, None if existing in (None, _PENDING_MARKER) else existing
+
+
+def remember_pending(email: str, raw_token: str | None) -> None:
+    """Store the minted code (or marker) in the claimed slot."""
+    window = _coalesce_seconds()
+    if window > 0:
+        cache.set(
+            _COALESCE_PREFIX + _email_key(email),
+            raw_token or _PENDING_MARKER,
+            timeout=window,
+        )
+
+
+def release_pending(email: str) -> None:
+    """Drop the coalescing slot (after a successful verify or a failed send)."""
+    cache.delete(_COALESCE_PREFIX + _email_key(email))
+
+
+def _failure_keys(ip: str, email: str | None) -> list[tuple[str, int]]:
+    keys = []
+    if ip:
+        keys.append(
+            (
+                _FAIL_IP_PREFIX + ip,
+                int(getattr(settings, "MAGIC_LINK_VERIFY_MAX_FAILURES_PER_IP", 20)),
+            )
+        )
+    if email:
+        keys.append(
+            (
+                _FAIL_EMAIL_PREFIX + _email_key(email),
+                int(getattr(settings, "MAGIC_LINK_VERIFY_MAX_FAILURES_PER_EMAIL", 5)),
+            )
+        )
+    return keys
+
+
+def verify_blocked(ip: str, email: str | None = None) -> int | None:
+    """Return a retry-after in seconds if verification is currently blocked."""
+    keys = _failure_keys(ip, email)
+    if not keys:
+        return None
+    counts = cache.get_many([key for key, _limit in keys])
+    for key, limit in keys:
+        if int(counts.get(key, 0)) >= limit:
+            return _failure_window()
+    return None
+
+
+def record_verify_failure(ip: str, email: str | None = None) -> None:
+    window = _failure_window()
+    for key, _limit in _failure_keys(ip, email):
+        # add() seeds the counter with the window TTL; incr() keeps that TTL
+        cache.add(key, 0, timeout=window)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Key expired between add() and incr()
+            cache.set(key, 1, timeout=window)
+
+
+def reset_verify_failures(email: str | None) -> None:
+    if email:
+        cache.delete(_FAIL_EMAIL_PREFIX + _email_key(email))
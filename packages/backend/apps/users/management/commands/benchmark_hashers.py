@@ -0,0 +1,65 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth.hashers import get_hasher
+from django.core.management.base import BaseCommand
+
+from boilerplate.hashers import BoundedHasherMixin
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure password hashes per second, single-threaded (per core) and "
+        "across all cores, for the configured hashers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "algorithms",
+            nargs="*",
+            default=["pbkdf2_sha256", "argon2"],
+            help="Hasher algorithms (default: pbkdf2_sha256 argon2).",
+        )
+        parser.add_argument("--seconds", type=float, default=3.0)
+        parser.add_argument(
+            "--threads", type=int, default=os.cpu_count() or 1, help="Parallel run."
+        )
+
+    def handle(self, *args, **options):
+        for algorithm in options["algorithms"]:
+            try:
+                hasher = get_hasher(algorithm)
+                # Raw hasher work, without the bounded executor in the way
+                if isinstance(hasher, BoundedHasherMixin):
+                    encode = super(BoundedHasherMixin, hasher).encode
+                else:
+                    encode = hasher.encode
+                encode("warm-up", hasher.salt())
+            except (ValueError, ImportError) as e:
+                self.stderr.write(f"{algorithm}: skipped ({e})")
+                continue
+            single = self._rate(encode, hasher, options["seconds"], 1)
+            parallel = self._rate(
+                encode, hasher, options["seconds"], options["threads"]
+            )
+            self.stdout.write(
+                f"{algorithm} ({type(hasher).__name__}): "
+                f"{single:.1f}/s per core ({1000 / single:.0f} ms per hash), "
+                f"{parallel:.1f}/s on {options['threads']} thread(s)"
+            )
+
+    def _rate(self, encode, hasher, seconds, threads):
+        deadline = time.monotonic() + seconds
+
+        def loop():
+            n = 0
+            while time.monotonic() < deadline:
+                encode("benchmark-password", hasher.salt())
+                n += 1
+            return n
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            total = sum(pool.map(lambda _: loop(), range(threads)))
+        return total / (time.monotonic() - start)
@@ -0,0 +1,38 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.users.bulk_import import FORMATS, import_users, parse_rows
+
+
+class Command(BaseCommand):
+    help = "Bulk-create users from a CSV or NDJSON file (same as the admin endpoint)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Input file, or - for stdin.")
+        parser.add_argument(
+            "--format",
+            choices=FORMATS,
+            default=None,
+            help="Input format (default: from the file extension).",
+        )
+        parser.add_argument("--batch-size", type=int, default=None)
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        fmt = options["format"] or ("csv" if path.endswith(".csv") else "ndjson")
+        try:
+            stream = sys.stdin.buffer if path == "-" else open(path, "rb")
+        except OSError as e:
+            raise CommandError(str(e)) from e
+
+        with stream:
+            result = import_users(
+                parse_rows(stream, fmt), batch_size=options["batch_size"]
+            )
+        self.stdout.write(
+            f"created {result.created}, skipped {result.skipped}, "
+            f"failed {result.failed}"
+        )
+        for error in result.errors:
+            self.stderr.write(f"line {error['line']}: {error['error']}")
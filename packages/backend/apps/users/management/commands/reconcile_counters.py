@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from boilerplate.counters import COUNTERS, reconcile
+
+
+class Command(BaseCommand):
+    help = "Recount denormalized counter columns and repair any drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        for counter in COUNTERS:
+            fixed = reconcile(counter, batch_size=options["batch_size"])
+            self.stdout.write(f"{counter}: repaired {fixed} row(s)")
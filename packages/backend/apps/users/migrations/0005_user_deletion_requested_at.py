@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-19 06:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0004_b2b_b2c_organization_fields"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="deletion_requested_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0005_user_deletion_requested_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                fields=["date_joined", "id"], name="user_joined_export_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-19 07:05
+#
+# Hand-edited: adds a backfill of the counter from existing device tokens.
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill(apps, schema_editor):
+    User = apps.get_model("users", "User")
+    DeviceToken = apps.get_model("notifications", "DeviceToken")
+    counts = (
+        DeviceToken.objects.filter(user=OuterRef("pk"))
+        .order_by()
+        .values("user")
+        .annotate(n=Count("pk"))
+        .values("n")
+    )
+    User.objects.update(device_token_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0006_user_user_joined_export_idx"),
+        ("notifications", "0004_devicetoken_devicetoken_export_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="device_token_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
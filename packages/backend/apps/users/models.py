@@ -56,6 +56,11 @@ class User(AbstractBaseUser, PermissionsMixin):
         blank=True,
         related_name="current_users",
     )
+    # Set when an account deletion is queued; the account is deactivated and
+    # its rows are removed in chunks by apps.users.tasks.delete_user_account
+    deletion_requested_at = models.DateTimeField(null=True, blank=True)
+    # Maintained by boilerplate.counters; repair with `manage.py reconcile_counters`
+    device_token_count = models.PositiveIntegerField(default=0, editable=False)
 
     objects = UserManager()
 
@@ -65,6 +70,10 @@ class User(AbstractBaseUser, PermissionsMixin):
     class Meta:
         verbose_name = "user"
         verbose_name_plural = "users"
+        indexes = [
+            # Incremental analytics export (apps.analytics) reads in this order
+            models.Index(fields=["date_joined", "id"], name="user_joined_export_idx"),
+        ]
 
     def __str__(self) -> str:  # pragma: no cover - trivial
         return self.email
@@ -0,0 +1,117 @@
+"""Account and personal workspace provisioning.
+
+``provision_user`` is the one way new accounts are created (registration and
+first magic-link sign-in). In B2C mode it writes the user, their personal
+organization and the admin membership with three INSERTs and returns the
+user with ``current_organization`` already attached, so callers never
+re-fetch it.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Case, When
+
+from apps.organizations.models import Membership, Organization
+
+
+def personal_workspace_name(user) -> str:
+    """``"<first name>'s Workspace"``, or the email prefix without a first name."""
+    if user.first_name:
+        return f"{user.first_name}'s Workspace"
+    return f"{user.email.split('@')[0]}'s Workspace"
+
+
+def bulk_provision_personal_orgs(users: list) -> list[Organization]:
+    """Create a personal workspace for each of ``users`` in three statements.
+
+    Organizations and admin memberships are bulk-inserted, then every user's
+    ``current_organization`` is set with a single ``UPDATE ... CASE``. The
+    ``users`` instances are updated in place.
+    """
+    if not users:
+        return []
+    # Primary keys are generated client-side, so the rows can be linked before insert
+    orgs = [
+        Organization(
+            name=personal_workspace_name(user),
+            owner=user,
+            is_personal=True,
+            # bulk_create skips the counter receivers (boilerplate.counters)
+            member_count=1,
+        )
+        for user in users
+    ]
+    Organization.objects.bulk_create(orgs)
+    Membership.objects.bulk_create(
+        [
+            Membership(user=user, organization=org, role=Membership.ROLE_ADMIN)
+            for user, org in zip(users, orgs, strict=True)
+        ]
+    )
+    get_user_model().objects.filter(pk__in=[u.pk for u in users]).update(
+        current_organization=Case(
+            *[
+                When(pk=user.pk, then=org.pk)
+                for user, org in zip(users, orgs, strict=True)
+            ]
+        )
+    )
+    for user, org in zip(users, orgs, strict=True):
+        user.current_organization = org
+    return orgs
+
+
+def _personal_org(user) -> Organization:
+    return Organization(
+        name=personal_workspace_name(user),
+        owner=user,
+        is_personal=True,
+        member_count=1,
+    )
+
+
+def _admin_membership(user, org) -> None:
+    # bulk_create skips the counter receivers; member_count starts at 1
+    Membership.objects.bulk_create(
+        [Membership(user=user, organization=org, role=Membership.ROLE_ADMIN)]
+    )
+
+
+def provision_user(email: str, password: str | None = None, **fields):
+    """Create a user and, in B2C mode, their personal workspace.
+
+    The user row is inserted with ``current_organization`` already pointing at
+    the organization inserted right after it; foreign keys are checked at
+    commit (deferred constraints), which is why this runs in a transaction.
+    """
+    User = get_user_model()
+    user = User(email=User.objects.normalize_email(email), **fields)
+    if password:
+        user.set_password(password)
+    else:
+        user.set_unusable_password()
+    if settings.APP_MODE != "b2c":
+        user.save(force_insert=True)
+        return user
+
+    org = _personal_org(user)
+    user.current_organization = org
+    with transaction.atomic(savepoint=False):
+        user.save(force_insert=True)
+        org.save(force_insert=True)
+        _admin_membership(user, org)
+    return user
+
+
+def create_personal_organization(user) -> Organization:
+    """Give an existing user a personal workspace and make it current (B2C mode)."""
+    org = _personal_org(user)
+    with transaction.atomic(savepoint=False):
+        org.save(force_insert=True)
+        _admin_membership(user, org)
+        user.current_organization = org
+        user.save(update_fields=["current_organization"])
+    return org
@@ -0,0 +1,43 @@
+from celery import shared_task
+
+from apps.users.magic_link import send_magic_link
+from boilerplate.dedup import DeduplicatedTask
+
+
+# Done marker outlives the link so redelivered messages never re-send it
+@shared_task(base=DeduplicatedTask, ignore_result=True, dedup_done_ttl=900)
+def send_magic_link_email(email, raw_token):
+    """Deliver a magic link email (routed to the ``email`` queue)."""
+    send_magic_link(email, raw_token)
+
+
+@shared_task(base=DeduplicatedTask, ignore_result=True, dedup_done_ttl=60)
+def delete_user_account(user_id, job_id=None):
+    """Delete an account marked for deletion, chunk by chunk (see boilerplate.deletion)."""
+    from boilerplate.deletion import run_plan, user_plan
+
+    return run_plan(user_plan(user_id), job_id=job_id)
+
+
+@shared_task(ignore_result=True)
+def export_user_data(user_id, job_id):
+    """Build a user's data export archive (see apps.users.export)."""
+    from django.contrib.auth import get_user_model
+
+    from apps.users.export import build_export
+    from boilerplate import task_status
+
+    try:
+        user = get_user_model().objects.get(pk=user_id)
+        build_export(user, job_id)
+    except Exception as e:
+        task_status.mark_failed(job_id, str(e))
+        raise
+    task_status.mark_succeeded(job_id, {"download": f"/api/v1/me/export/{job_id}"})
+
+
+@shared_task(ignore_result=True)
+def purge_expired_exports():
+    from apps.users.export import purge_expired_exports as purge
+
+    return purge()
@@ -1,6 +1,14 @@
 import os
+from fnmatch import fnmatch
 
 from celery import Celery
+from celery.signals import (
+    task_failure,
+    task_prerun,
+    task_success,
+    worker_init,
+    worker_process_shutdown,
+)
 
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "boilerplate.settings")
@@ -13,10 +21,81 @@ app = Celery("boilerplate")
 #   should have a `CELERY_` prefix.
 app.config_from_object("django.conf:settings", namespace="CELERY")
 
+
+def queue_for_task(task_name: str) -> str:
+    """Resolve the queue a task is routed to (glob patterns, first match wins)."""
+    for pattern, route in (app.conf.task_routes or {}).items():
+        if fnmatch(task_name, pattern):
+            return route.get("queue", app.conf.task_default_queue)
+    return app.conf.task_default_queue
+
+
+class QueuePolicyAnnotations:
+    """Apply ``TASK_QUEUE_POLICIES`` (acks_late, time limits) by routed queue.
+
+    Annotations take precedence over decorator options, so a task that needs
+    different limits belongs on a different queue.
+    """
+
+    def annotate(self, task):
+        from django.conf import settings
+
+        policies = getattr(settings, "TASK_QUEUE_POLICIES", {})
+        return policies.get(queue_for_task(task.name))
+
+
+app.conf.task_annotations = (QueuePolicyAnnotations(),)
+
 # Load task modules from all registered Django apps.
 app.autodiscover_tasks()
 
 
+@worker_init.connect
+def _start_metrics_server(**_kwargs):
+    """Expose worker metrics (e.g. retention counters) when a port is set.
+
+    Counters live in the process that increments them, so only single-process
+    pools (``--pool solo``, as the maintenance pool runs) report complete values.
+    """
+    from django.conf import settings
+
+    port = getattr(settings, "WORKER_METRICS_PORT", 0)
+    if port:
+        from prometheus_client import start_http_server
+
+        start_http_server(port)
+
+
+@worker_process_shutdown.connect
+def _close_pooled_email_connection(**_kwargs):
+    from boilerplate.mail import reset_pooled_connection
+
+    reset_pooled_connection()
+
+
+# Lifecycle updates for jobs tracked in boilerplate.task_status (untracked
+# task ids are ignored by the store).
+@task_prerun.connect
+def _task_status_running(task_id=None, **_kwargs):
+    from boilerplate import task_status
+
+    task_status.mark_running(task_id)
+
+
+@task_success.connect
+def _task_status_succeeded(sender=None, **_kwargs):
+    from boilerplate import task_status
+
+    task_status.mark_succeeded(sender.request.id)
+
+
+@task_failure.connect
+def _task_status_failed(task_id=None, exception=None, **_kwargs):
+    from boilerplate import task_status
+
+    task_status.mark_failed(task_id, str(exception))
+
+
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     print(f"Request: {self.request!r}")
@@ -0,0 +1,122 @@
+"""Denormalized counter columns kept in step with their source rows.
+
+``Organization.member_count`` counts memberships and ``User.device_token_count``
+counts device tokens. Signal receivers adjust the counter with a single
+``UPDATE ... SET n = n + 1`` (``F()``) whenever a source row is created,
+deleted or moved to another parent, inside the caller's transaction. Reads of
+the counter are plain column reads instead of ``COUNT`` joins.
+
+``bulk_create`` and ``QuerySet.update`` skip signals. Code that uses them on
+a source model must call ``adjust`` itself. The ``reconcile_counters``
+command recounts everything and repairs drift.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+
+from django.apps import apps
+from django.db.models import Count, F
+from django.db.models.signals import post_delete, post_init, post_save
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Counter:
+    model: str  # "app_label.ModelName" holding the column
+    field: str  # counter column
+    source: str  # "app_label.ModelName" of the counted rows
+    fk: str  # source column pointing at ``model``
+
+    def __str__(self) -> str:
+        return f"{self.model}.{self.field}"
+
+
+COUNTERS = [
+    Counter(
+        "organizations.Organization",
+        "member_count",
+        "organizations.Membership",
+        "organization_id",
+    ),
+    Counter("users.User", "device_token_count", "notifications.DeviceToken", "user_id"),
+]
+
+
+def adjust(counter: Counter, pk, delta: int) -> None:
+    if pk is None or not delta:
+        return
+    model = apps.get_model(counter.model)
+    model._default_manager.filter(pk=pk).update(
+        **{counter.field: F(counter.field) + delta}
+    )
+
+
+def _loaded_attr(counter: Counter) -> str:
+    return f"_counted_{counter.fk}"
+
+
+def connect(source: str) -> None:
+    """Attach the receivers for every counter fed by ``source``.
+
+    Called from the source app's ``AppConfig.ready``.
+    """
+    for counter in COUNTERS:
+        if counter.source != source:
+            continue
+        attr = _loaded_attr(counter)
+
+        def remember(sender, instance, counter=counter, attr=attr, **kwargs):
+            # Parent as loaded, so a save that moves the row adjusts both sides
+            instance.__dict__[attr] = instance.__dict__.get(counter.fk)
+
+        def saved(sender, instance, created, counter=counter, attr=attr, **kwargs):
+            new = getattr(instance, counter.fk)
+            old = None if created else instance.__dict__.get(attr)
+            if old != new:
+                adjust(counter, old, -1)
+                adjust(counter, new, 1)
+            instance.__dict__[attr] = new
+
+        def deleted(sender, instance, counter=counter, **kwargs):
+            adjust(counter, getattr(instance, counter.fk), -1)
+
+        uid = f"counter:{counter}"
+        post_init.connect(remember, sender=source, weak=False, dispatch_uid=uid)
+        post_save.connect(saved, sender=source, weak=False, dispatch_uid=uid)
+        post_delete.connect(deleted, sender=source, weak=False, dispatch_uid=uid)
+
+
+def reconcile(counter: Counter, batch_size: int = 1000) -> int:
+    """Recount ``counter`` for every parent row; returns the number of rows fixed."""
+    model = apps.get_model(counter.model)
+    source = apps.get_model(counter.source)
+    fixed = 0
+    last_pk = None
+    while True:
+        parents = model._default_manager.order_by("pk")
+        if last_pk is not None:
+            parents = parents.filter(pk__gt=last_pk)
+        stored = dict(parents.values_list("pk", counter.field)[:batch_size])
+        if not stored:
+            break
+        actual = dict(
+            source._default_manager.filter(**{f"{counter.fk}__in": list(stored)})
+            .values_list(counter.fk)
+            .annotate(n=Count("pk"))
+            .order_by()
+        )
+        for pk, value in stored.items():
+            if actual.get(pk, 0) != value:
+                model._default_manager.filter(pk=pk).update(
+                    **{counter.field: actual.get(pk, 0)}
+                )
+                fixed += 1
+        last_pk = list(stored)[-1]
+        if len(stored) < batch_size:
+            break
+    if fixed:
+        logger.warning(f"Counter {counter}: repaired {fixed} row(s)")
+    return fixed
@@ -0,0 +1,105 @@
+"""Celery task base class that drops duplicate enqueues and executions.
+
+Each invocation has a dedup key: the caller's ``dedup_key`` (passed as an
+``apply_async`` option or a ``_dedup_key`` kwarg, e.g. through the outbox) or,
+by default, a hash of the task name and arguments. Locks are taken with
+``cache.add`` which on the Redis cache backend is ``SET key value NX EX ttl``.
+
+- Enqueue: a second ``apply_async`` with the same key while the first is still
+  queued returns the first task's ``AsyncResult`` instead of publishing again.
+- Execution: only one worker may run a key at a time, and after a successful
+  run the key is remembered for ``dedup_done_ttl`` seconds so late duplicates
+  (client retries, broker redeliveries with ``acks_late``, outbox
+  at-least-once) are skipped without calling the provider again.
+
+Failed runs release the lock so Celery retries and later attempts still run.
+
+Usage::
+
+    @shared_task(base=DeduplicatedTask, dedup_done_ttl=600)
+    def send_something(obj_id): ...
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+
+from celery import Task
+from celery.utils import uuid
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+DEDUP_KWARG = "_dedup_key"
+
+
+class DeduplicatedTask(Task):
+    abstract = True
+
+    # Seconds a queued invocation blocks identical enqueues
+    dedup_enqueue_ttl = 60
+    # Upper bound on how long a running invocation holds its lock
+    dedup_lock_ttl = 600
+    # Seconds a completed key keeps suppressing duplicates
+    dedup_done_ttl = 3600
+
+    def dedup_key(self, args, kwargs) -> str | None:
+        """Return the dedup key for an invocation (override for custom keys)."""
+        if kwargs.get(DEDUP_KWARG):
+            return str(kwargs[DEDUP_KWARG])
+        payload = json.dumps([list(args), kwargs], sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _cache_keys(self, args, kwargs) -> tuple[str, str, str] | None:
+        key = self.dedup_key(args, kwargs)
+        if not key:
+            return None
+        base = f"dedup:{self.name}:{key}"
+        return f"{base}:queued", f"{base}:running", f"{base}:done"
+
+    def apply_async(self, args=None, kwargs=None, task_id=None, **options):
+        args = tuple(args or ())
+        kwargs = dict(kwargs or {})
+        if options.get("dedup_key"):
+            kwargs[DEDUP_KWARG] = options.pop("dedup_key")
+        # Celery retries re-enter apply_async; never dedupe those
+        keys = None if options.get("retries") else self._cache_keys(args, kwargs)
+        if keys:
+            queued_key, _running_key, done_key = keys
+            task_id = task_id or uuid()
+            if cache.get(done_key):
+                logger.info(f"Skipping enqueue of {self.name}: already completed")
+                return self.AsyncResult(task_id)
+            if not cache.add(queued_key, task_id, timeout=self.dedup_enqueue_ttl):
+                existing = cache.get(queued_key) or task_id
+                logger.info(f"Merged duplicate enqueue of {self.name} into {existing}")
+                return self.AsyncResult(existing)
+        return super().apply_async(args, kwargs, task_id=task_id, **options)
+
+    def __call__(self, *args, **kwargs):
+        keys = self._cache_keys(args, kwargs)
+        kwargs.pop(DEDUP_KWARG, None)
+        if not keys:
+            return super().__call__(*args, **kwargs)
+
+        queued_key, running_key, done_key = keys
+        if cache.get(done_key):
+            logger.info(f"Skipping duplicate run of {self.name}: already completed")
+            return None
+        owner = self.request.id or uuid()
+        if not cache.add(running_key, owner, timeout=self.dedup_lock_ttl):
+            if cache.get(running_key) != owner:
+                logger.info(f"Skipping duplicate run of {self.name}: already running")
+                return None
+        # Running now; identical enqueues are covered by the lock/done markers
+        cache.delete(queued_key)
+        try:
+            result = super().__call__(*args, **kwargs)
+        except BaseException:
+            cache.delete(running_key)
+            raise
+        cache.set(done_key, 1, timeout=self.dedup_done_ttl)
+        cache.delete(running_key)
+        return result
@@ -0,0 +1,151 @@
+"""Password hashers that run on a dedicated, bounded executor.
+
+Hashing and verifying a password burns tens to hundreds of milliseconds of
+CPU. Run inline, a login burst occupies every request thread (under ASGI,
+the small pool that runs sync views), and every other endpoint stalls behind
+it. The hashers below send ``encode``/``verify`` to their own thread pool of
+``PASSWORD_HASH_WORKERS`` threads (default: one per CPU; hashlib and
+argon2-cffi release the GIL, so these run in parallel). At most
+``PASSWORD_HASH_MAX_PENDING`` further calls may wait for a thread. A call
+that cannot get a slot within ``PASSWORD_HASH_WAIT_SECONDS`` raises
+``PasswordHashingBusy``, which DRF turns into ``503`` with ``Retry-After``,
+so overload sheds logins instead of everything else.
+
+``PASSWORD_HASHER_PROFILE`` picks the hasher for new passwords (see
+settings). The hashers keep Django's algorithm names, so stored hashes remain
+valid and are upgraded on the next successful login when the profile changes.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+)
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class PasswordHashingBusy(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Too many sign-in attempts in progress, try again shortly."
+    default_code = "password_hashing_busy"
+
+    def __init__(self, wait: int):
+        super().__init__()
+        # Picked up by DRF's exception handler as the Retry-After header
+        self.wait = wait
+
+
+_local = threading.local()
+
+
+def _on_executor(fn, *args):
+    _local.on_executor = True
+    try:
+        return fn(*args)
+    finally:
+        _local.on_executor = False
+
+
+class HashingExecutor:
+    def __init__(self, workers: int, max_pending: int, wait_seconds: float):
+        self.workers = workers
+        self.wait_seconds = wait_seconds
+        self._slots = threading.BoundedSemaphore(workers + max_pending)
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hash"
+        )
+
+    def run(self, fn, *args):
+        if getattr(_local, "on_executor", False):
+            # Nested call (PBKDF2's verify() calls encode()); already bounded
+            return fn(*args)
+        if not self._slots.acquire(timeout=self.wait_seconds):
+            raise PasswordHashingBusy(
+                wait=int(getattr(settings, "PASSWORD_HASH_RETRY_AFTER_SECONDS", 1))
+            )
+        try:
+            return self._pool.submit(_on_executor, fn, *args).result()
+        finally:
+            self._slots.release()
+
+
+_executor: HashingExecutor | None = None
+_executor_pid: int | None = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> HashingExecutor:
+    """Process-wide executor, rebuilt after a fork (pre-forking servers)."""
+    global _executor, _executor_pid
+    pid = os.getpid()
+    if _executor is None or _executor_pid != pid:
+        with _executor_lock:
+            if _executor is None or _executor_pid != pid:
+                _executor = HashingExecutor(
+                    workers=int(
+                        getattr(settings, "PASSWORD_HASH_WORKERS", 0)
+                        or os.cpu_count()
+                        or 1
+                    ),
+                    max_pending=int(getattr(settings, "PASSWORD_HASH_MAX_PENDING", 16)),
+                    wait_seconds=float(
+                        getattr(settings, "PASSWORD_HASH_WAIT_SECONDS", 1.0)
+                    ),
+                )
+                _executor_pid = pid
+    return _executor
+
+
+def reset_executor() -> None:
+    """Drop the executor so the next call picks up changed settings (tests)."""
+    global _executor
+    with _executor_lock:
+        _executor = None
+
+
+class BoundedHasherMixin:
+    def encode(self, password, salt, *args, **kwargs):
+        return get_executor().run(
+            lambda: super(BoundedHasherMixin, self).encode(
+                password, salt, *args, **kwargs
+            )
+        )
+
+    def verify(self, password, encoded):
+        return get_executor().run(
+            lambda: super(BoundedHasherMixin, self).verify(password, encoded)
+        )
+
+
+class BoundedPBKDF2PasswordHasher(BoundedHasherMixin, PBKDF2PasswordHasher):
+    """PBKDF2-SHA256; ``PASSWORD_PBKDF2_ITERATIONS`` overrides Django's default."""
+
+    @property
+    def iterations(self):
+        return int(
+            getattr(settings, "PASSWORD_PBKDF2_ITERATIONS", 0)
+            or PBKDF2PasswordHasher.iterations
+        )
+
+
+class BoundedArgon2PasswordHasher(BoundedHasherMixin, Argon2PasswordHasher):
+    """Argon2id with costs from ``PASSWORD_ARGON2_*`` (needs ``argon2-cffi``)."""
+
+    @property
+    def time_cost(self):
+        return int(getattr(settings, "PASSWORD_ARGON2_TIME_COST", 2))
+
+    @property
+    def memory_cost(self):
+        return int(getattr(settings, "PASSWORD_ARGON2_MEMORY_COST_KIB", 19456))
+
+    @property
+    def parallelism(self):
+        return int(getattr(settings, "PASSWORD_ARGON2_PARALLELISM", 1))
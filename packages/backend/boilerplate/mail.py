@@ -0,0 +1,95 @@
+"""Email delivery helpers shared by the Celery email tasks.
+
+Each worker process keeps a single email backend connection open and reuses it
+across tasks (SMTP session or the provider's HTTP session for Anymail backends),
+and templates are compiled once per process instead of on every render.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from functools import lru_cache
+from typing import Any
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.template.loader import get_template
+
+logger = logging.getLogger(__name__)
+
+_connection = None
+_connection_pid: int | None = None
+
+
+@lru_cache(maxsize=32)
+def get_cached_template(template_name: str):
+    """Return a compiled template, loaded at most once per process."""
+    return get_template(template_name)
+
+
+def render_cached(template_name: str, context: dict[str, Any]) -> str:
+    return get_cached_template(template_name).render(context)
+
+
+def get_pooled_connection():
+    """Return this process's open email backend connection.
+
+    The connection is recreated after a fork (Celery prefork children) so
+    sockets are never shared between processes.
+    """
+    global _connection, _connection_pid
+    pid = os.getpid()
+    if _connection is None or _connection_pid != pid:
+        _connection = get_connection(fail_silently=True)
+        _connection_pid = pid
+        try:
+            _connection.open()
+        except Exception:  # pragma: no cover - backend specific
+            logger.warning("Could not open pooled email connection", exc_info=True)
+    return _connection
+
+
+def reset_pooled_connection() -> None:
+    """Close and drop the pooled connection (next send reopens it)."""
+    global _connection, _connection_pid
+    if _connection is not None and _connection_pid == os.getpid():
+        try:
+            _connection.close()
+        except Exception:  # pragma: no cover - backend specific
+            logger.warning("Error closing pooled email connection", exc_info=True)
+    _connection = None
+    _connection_pid = None
+
+
+def send_email(
+    subject: str,
+    text_body: str,
+    to: list[str],
+    *,
+    html_body: str | None = None,
+    from_email: str | None = None,
+) -> int:
+    """Send one message over the pooled connection.
+
+    Backends are used with ``fail_silently=True`` (same as the previous
+    ``send_mail`` calls), so a dropped keep-alive connection shows up as zero
+    messages sent; in that case the connection is reopened and the send is
+    retried once.
+    """
+    sender = from_email or getattr(
+        settings, "DEFAULT_FROM_EMAIL", "no-reply@example.local"
+    )
+    for attempt in range(2):
+        message = EmailMultiAlternatives(
+            subject, text_body, sender, to, connection=get_pooled_connection()
+        )
+        if html_body:
+            message.attach_alternative(html_body, "text/html")
+        sent = message.send(fail_silently=True)
+        if sent:
+            return sent
+        reset_pooled_connection()
+        if attempt == 0:
+            logger.info("Email send returned 0, retrying on a fresh connection")
+    return 0
@@ -2,6 +2,7 @@ import ast
 from pathlib import Path
 
 import environ
+from celery.schedules import crontab
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -30,6 +31,14 @@ env = environ.Env(
         bool,
         True,
     ),  # include raw token in response when DEBUG
+    # Repeated requests for the same email within this window reuse the pending code
+    MAGIC_LINK_COALESCE_SECONDS=(int, 60),
+    # Failed verify attempts allowed per client IP / per email before 429
+    MAGIC_LINK_VERIFY_MAX_FAILURES_PER_IP=(int, 20),
+    MAGIC_LINK_VERIFY_MAX_FAILURES_PER_EMAIL=(int, 5),
+    MAGIC_LINK_VERIFY_FAILURE_WINDOW_SECONDS=(int, 900),
+    # Shared cache (e.g. redis://redis:6379/1); empty uses per-process memory
+    REDIS_URL=(str, ""),
 )
 # Load .env if present at project root (packages/backend/.env)
 env_file = BASE_DIR / ".env"
@@ -94,6 +103,9 @@ INSTALLED_APPS = [
     "apps.public_api",
     "apps.admin_api",
     "apps.featureflags",
+    "apps.outbox",
+    "apps.retention",
+    "apps.analytics",
     "django_prometheus",
 ]
 
@@ -140,6 +152,10 @@ DATABASES = {
         default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}",
     )
 }
+# Optional read replica for the analytics export (apps.analytics)
+if env("ANALYTICS_DATABASE_URL", default=None):
+    DATABASES["analytics"] = env.db("ANALYTICS_DATABASE_URL")
+ANALYTICS_DB_ALIAS = "analytics" if "analytics" in DATABASES else "default"
 
 # Auth: custom user model
 AUTH_USER_MODEL = "users.User"
@@ -160,6 +176,43 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing (boilerplate.hashers): hashes run on a bounded executor and
+# overload answers 503 + Retry-After. PASSWORD_HASHER_PROFILE picks the hasher
+# for new passwords: "pbkdf2" (default) or "argon2" (needs argon2-cffi).
+# Existing hashes of either kind keep working and are upgraded on login.
+PASSWORD_HASHER_PROFILE = env("PASSWORD_HASHER_PROFILE", default="pbkdf2").lower()
+_BOUNDED_HASHERS = {
+    "pbkdf2": "boilerplate.hashers.BoundedPBKDF2PasswordHasher",
+    "argon2": "boilerplate.hashers.BoundedArgon2PasswordHasher",
+}
+if PASSWORD_HASHER_PROFILE not in _BOUNDED_HASHERS:
+    raise ValueError(
+        f"PASSWORD_HASHER_PROFILE must be 'pbkdf2' or 'argon2', "
+        f"got '{PASSWORD_HASHER_PROFILE}'"
+    )
+PASSWORD_HASHERS = [
+    _BOUNDED_HASHERS[PASSWORD_HASHER_PROFILE],
+    *[h for p, h in _BOUNDED_HASHERS.items() if p != PASSWORD_HASHER_PROFILE],
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+# Threads hashing in parallel (0 = one per CPU), calls allowed to wait for a
+# thread, and how long a call waits for a slot before the 503
+PASSWORD_HASH_WORKERS = env.int("PASSWORD_HASH_WORKERS", default=0)
+PASSWORD_HASH_MAX_PENDING = env.int("PASSWORD_HASH_MAX_PENDING", default=16)
+PASSWORD_HASH_WAIT_SECONDS = env.float("PASSWORD_HASH_WAIT_SECONDS", default=1.0)
+PASSWORD_HASH_RETRY_AFTER_SECONDS = env.int(
+    "PASSWORD_HASH_RETRY_AFTER_SECONDS", default=1
+)
+# Cost parameters; 0 keeps Django's PBKDF2 default. Argon2 defaults follow the
+# OWASP baseline (19 MiB, 2 passes, 1 lane); check with `manage.py benchmark_hashers`
+PASSWORD_PBKDF2_ITERATIONS = env.int("PASSWORD_PBKDF2_ITERATIONS", default=0)
+PASSWORD_ARGON2_TIME_COST = env.int("PASSWORD_ARGON2_TIME_COST", default=2)
+PASSWORD_ARGON2_MEMORY_COST_KIB = env.int(
+    "PASSWORD_ARGON2_MEMORY_COST_KIB", default=19456
+)
+PASSWORD_ARGON2_PARALLELISM = env.int("PASSWORD_ARGON2_PARALLELISM", default=1)
+
 # Internationalization
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
@@ -170,8 +223,56 @@ USE_TZ = True
 STATIC_URL = "static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+# "exports" holds user data export archives (apps.users.export). Local disk by
+# default; set EXPORT_STORAGE_BACKEND (e.g. storages.backends.s3.S3Storage from
+# django-storages) for object storage, where EXPORT_LOCATION is the key prefix.
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+    "exports": {
+        "BACKEND": env(
+            "EXPORT_STORAGE_BACKEND",
+            default="django.core.files.storage.FileSystemStorage",
+        ),
+        "OPTIONS": {
+            "location": env("EXPORT_LOCATION", default=str(BASE_DIR / "exports"))
+        },
+    },
+    # Incremental analytics export files (apps.analytics.exporter)
+    "analytics": {
+        "BACKEND": env(
+            "ANALYTICS_STORAGE_BACKEND",
+            default="django.core.files.storage.FileSystemStorage",
+        ),
+        "OPTIONS": {
+            "location": env(
+                "ANALYTICS_LOCATION", default=str(BASE_DIR / "analytics-export")
+            )
+        },
+    },
+}
+# Finished exports are deleted after this many hours
+DATA_EXPORT_TTL_HOURS = env.int("DATA_EXPORT_TTL_HOURS", default=72)
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Cache: Redis when REDIS_URL is set (required for counters/coalescing to be
+# shared across processes), otherwise local memory for dev/tests.
+REDIS_URL = env("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 # DRF config: schema, pagination, throttling, errors
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
@@ -187,6 +288,8 @@ REST_FRAMEWORK = {
         "user": "5000/minute",
         # Used by admin endpoints via throttle_scope = 'admin'
         "admin": "500/minute",
+        # Data export jobs (POST /api/v1/me/export)
+        "data_export": "5/hour",
     },
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework_simplejwt.authentication.JWTAuthentication",
@@ -260,6 +363,14 @@ RESEND_API_KEY = env("RESEND_API_KEY")
 MAGIC_LINK_VERIFY_URL = env("MAGIC_LINK_VERIFY_URL")
 MAGIC_LINK_EXPIRY_MINUTES = env("MAGIC_LINK_EXPIRY_MINUTES")
 MAGIC_LINK_DEBUG_ECHO_TOKEN = env("MAGIC_LINK_DEBUG_ECHO_TOKEN")
+MAGIC_LINK_COALESCE_SECONDS = env("MAGIC_LINK_COALESCE_SECONDS")
+MAGIC_LINK_VERIFY_MAX_FAILURES_PER_IP = env("MAGIC_LINK_VERIFY_MAX_FAILURES_PER_IP")
+MAGIC_LINK_VERIFY_MAX_FAILURES_PER_EMAIL = env(
+    "MAGIC_LINK_VERIFY_MAX_FAILURES_PER_EMAIL"
+)
+MAGIC_LINK_VERIFY_FAILURE_WINDOW_SECONDS = env(
+    "MAGIC_LINK_VERIFY_FAILURE_WINDOW_SECONDS"
+)
 
 # (Idempotency middleware already included above in correct order)
 
@@ -300,3 +411,98 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
+
+# Background job status entries (boilerplate.task_status) expire after this
+TASK_STATUS_TTL_SECONDS = env.int("TASK_STATUS_TTL_SECONDS", default=86400)
+
+# Queue topology: each queue gets its own worker pool (see charts/api values
+# `worker.pools`) so a slow email provider cannot stall push or maintenance.
+# Unrouted tasks go to "default".
+CELERY_TASK_DEFAULT_QUEUE = "default"
+CELERY_TASK_ROUTES = {
+    "apps.users.tasks.send_magic_link_email": {"queue": "email"},
+    "apps.organizations.tasks.send_org_invite_email*": {"queue": "email"},
+    "apps.notifications.tasks.send_push*": {"queue": "push"},
+    "apps.notifications.tasks.*": {"queue": "notifications"},
+    "apps.retention.tasks.*": {"queue": "maintenance"},
+    "apps.users.tasks.delete_user_account": {"queue": "maintenance"},
+    "apps.users.tasks.purge_expired_exports": {"queue": "maintenance"},
+    "apps.analytics.tasks.*": {"queue": "maintenance"},
+    "apps.admin_api.tasks.refresh_stats": {"queue": "maintenance"},
+    "apps.organizations.tasks.delete_organization": {"queue": "maintenance"},
+}
+# Late ack + reject-on-lost means a task is redelivered if its worker dies;
+# only safe for idempotent tasks, hence enabled per queue.
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+
+# Per-queue execution policy applied to every task routed to the queue
+# (boilerplate.celery.QueuePolicyAnnotations). Prefetch and concurrency are
+# worker options and live with each pool in the chart.
+TASK_QUEUE_POLICIES = {
+    "default": {"acks_late": False, "soft_time_limit": 300, "time_limit": 360},
+    "email": {"acks_late": True, "soft_time_limit": 30, "time_limit": 60},
+    "push": {"acks_late": True, "soft_time_limit": 20, "time_limit": 40},
+    "notifications": {"acks_late": True, "soft_time_limit": 60, "time_limit": 90},
+    "maintenance": {"acks_late": True, "soft_time_limit": 1800, "time_limit": 2100},
+}
+
+# Prometheus endpoint on Celery workers (0 disables); see boilerplate/celery.py
+WORKER_METRICS_PORT = env.int("WORKER_METRICS_PORT", default=0)
+
+# Periodic jobs (run `celery -A boilerplate beat`; one beat process per cluster)
+CELERY_BEAT_SCHEDULE = {
+    "retention-purge": {
+        "task": "apps.retention.tasks.run_retention",
+        "schedule": crontab(minute=17),
+    },
+    "export-cleanup": {
+        "task": "apps.users.tasks.purge_expired_exports",
+        "schedule": crontab(minute=47),
+    },
+    "analytics-export": {
+        "task": "apps.analytics.tasks.export_analytics",
+        "schedule": crontab(minute="*/15"),
+    },
+    "admin-stats": {
+        "task": "apps.admin_api.tasks.refresh_stats",
+        "schedule": crontab(minute="*/10"),
+    },
+}
+
+# Background account/organization deletion (boilerplate.deletion): rows per
+# chunk transaction and pause between chunks
+DELETION_CHUNK_SIZE = env.int("DELETION_CHUNK_SIZE", default=500)
+DELETION_CHUNK_SLEEP_SECONDS = env.float("DELETION_CHUNK_SLEEP_SECONDS", default=0.1)
+
+# Bulk user import (apps.users.bulk_import): users written per transaction
+USER_IMPORT_BATCH_SIZE = env.int("USER_IMPORT_BATCH_SIZE", default=500)
+
+# Admin audit writer (apps.admin_api.audit): "buffered" (background thread,
+# bulk inserts), "durable" (Redis list + flush task, at-least-once; needs
+# REDIS_URL) or "sync" (insert in the request).
+AUDIT_SINK = env("AUDIT_SINK", default="buffered")
+AUDIT_FLUSH_INTERVAL_SECONDS = env.float("AUDIT_FLUSH_INTERVAL_SECONDS", default=1.0)
+AUDIT_FLUSH_BATCH_SIZE = env.int("AUDIT_FLUSH_BATCH_SIZE", default=200)
+AUDIT_BUFFER_MAX_SIZE = env.int("AUDIT_BUFFER_MAX_SIZE", default=10000)
+if AUDIT_SINK == "durable":
+    CELERY_BEAT_SCHEDULE["audit-flush"] = {
+        "task": "apps.admin_api.tasks.flush_audit_log",
+        "schedule": 5.0,
+    }
+
+# Retention engine (apps.retention): expired rows are deleted in small batches
+# with a pause in between; a run stops after RETENTION_MAX_SECONDS_PER_RUN and
+# the next hourly run picks up the rest.
+RETENTION_BATCH_SIZE = env.int("RETENTION_BATCH_SIZE", default=1000)
+RETENTION_BATCH_SLEEP_SECONDS = env.float("RETENTION_BATCH_SLEEP_SECONDS", default=0.5)
+RETENTION_MAX_SECONDS_PER_RUN = env.int("RETENTION_MAX_SECONDS_PER_RUN", default=600)
+# PostgreSQL lock_timeout per batch; a blocked batch ends the run instead of waiting
+RETENTION_LOCK_TIMEOUT_MS = env.int("RETENTION_LOCK_TIMEOUT_MS", default=2000)
+# Per-policy keep overrides in days, e.g. "admin_audit=730,notifications=14"
+RETENTION_KEEP_DAYS = env.dict("RETENTION_KEEP_DAYS", cast={"value": int}, default={})
+
+# Incremental analytics export (apps.analytics): rows per batch/file and how
+# far behind "now" the export stays so late-committing rows are not skipped
+ANALYTICS_EXPORT_BATCH_SIZE = env.int("ANALYTICS_EXPORT_BATCH_SIZE", default=5000)
+ANALYTICS_EXPORT_LAG_SECONDS = env.int("ANALYTICS_EXPORT_LAG_SECONDS", default=60)
@@ -0,0 +1,235 @@
+"""Lightweight status/progress store for background jobs.
+
+Each tracked job is a small Redis hash (``state``, ``current``, ``total``,
+``message``, ``user``, ``version``, ``updated``) with a TTL, so clients can poll
+status without touching Celery's result backend. Every update bumps
+``version`` and publishes on a per-job channel; readers long-poll (or stream
+SSE) by waiting for a version newer than the one they already have.
+
+Without ``REDIS_URL`` the store falls back to the Django cache with polling,
+which is enough for local development and tests.
+
+A job id is usually the Celery task id (``track_task`` + ``apply_async(task_id=...)``)
+but any string works, e.g. one id shared by several batch tasks that call
+``advance``.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import uuid
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+STATE_QUEUED = "queued"
+STATE_RUNNING = "running"
+STATE_SUCCEEDED = "succeeded"
+STATE_FAILED = "failed"
+TERMINAL_STATES = frozenset({STATE_SUCCEEDED, STATE_FAILED})
+
+_KEY_PREFIX = "taskstatus:"
+_INT_FIELDS = ("current", "total", "version")
+
+
+def _ttl() -> int:
+    return int(getattr(settings, "TASK_STATUS_TTL_SECONDS", 86400))
+
+
+def _key(job_id: str) -> str:
+    return f"{_KEY_PREFIX}{job_id}"
+
+
+def _decode(raw: dict[str, Any]) -> dict[str, Any] | None:
+    if not raw:
+        return None
+    data = dict(raw)
+    for field in _INT_FIELDS:
+        data[field] = int(data.get(field) or 0)
+    data["updated"] = float(data.get("updated") or 0)
+    return data
+
+
+class _RedisStore:
+    def __init__(self, url: str):
+        import redis
+
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+
+    def create(self, job_id: str, fields: dict[str, Any]) -> None:
+        key = _key(job_id)
+        pipe = self.client.pipeline()
+        pipe.delete(key)
+        pipe.hset(key, mapping={**fields, "version": 1, "updated": time.time()})
+        pipe.expire(key, _ttl())
+        pipe.publish(key, 1)
+        pipe.execute()
+
+    def update(
+        self, job_id: str, fields: dict[str, Any], incr: dict[str, int] | None = None
+    ) -> dict[str, Any] | None:
+        key = _key(job_id)
+        if not self.client.exists(key):
+            return None
+        pipe = self.client.pipeline()
+        for field, amount in (incr or {}).items():
+            pipe.hincrby(key, field, amount)
+        if fields:
+            pipe.hset(key, mapping=fields)
+        pipe.hset(key, "updated", time.time())
+        pipe.hincrby(key, "version", 1)
+        pipe.expire(key, _ttl())
+        pipe.hgetall(key)
+        data = pipe.execute()[-1]
+        self.client.publish(key, data.get("version", 0))
+        return _decode(data)
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        return _decode(self.client.hgetall(_key(job_id)))
+
+    def wait(self, job_id: str, after_version: int, timeout: float) -> None:
+        key = _key(job_id)
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(key)
+            # Re-check after subscribing so an update in between isn't missed
+            current = self.get(job_id)
+            if current is None or current["version"] > after_version:
+                return
+            deadline = time.monotonic() + timeout
+            while (remaining := deadline - time.monotonic()) > 0:
+                if pubsub.get_message(timeout=remaining):
+                    return
+        finally:
+            pubsub.close()
+
+
+class _CacheStore:
+    """Fallback using the Django cache; waits by polling."""
+
+    poll_interval = 0.25
+
+    def create(self, job_id: str, fields: dict[str, Any]) -> None:
+        cache.set(
+            _key(job_id),
+            {**fields, "version": 1, "updated": time.time()},
+            timeout=_ttl(),
+        )
+
+    def update(
+        self, job_id: str, fields: dict[str, Any], incr: dict[str, int] | None = None
+    ) -> dict[str, Any] | None:
+        data = cache.get(_key(job_id))
+        if data is None:
+            return None
+        for field, amount in (incr or {}).items():
+            data[field] = int(data.get(field) or 0) + amount
+        data.update(fields)
+        data["version"] = int(data.get("version") or 0) + 1
+        data["updated"] = time.time()
+        cache.set(_key(job_id), data, timeout=_ttl())
+        return _decode(data)
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        return _decode(cache.get(_key(job_id)) or {})
+
+    def wait(self, job_id: str, after_version: int, timeout: float) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            current = self.get(job_id)
+            if current is None or current["version"] > after_version:
+                return
+            time.sleep(self.poll_interval)
+
+
+_store = None
+
+
+def get_store():
+    global _store
+    if _store is None:
+        url = getattr(settings, "REDIS_URL", "")
+        _store = _RedisStore(url) if url else _CacheStore()
+    return _store
+
+
+def track_task(
+    user_id, *, job_id: str | None = None, total: int = 0, message: str = ""
+) -> str:
+    """Start tracking a job owned by ``user_id``; returns the job id."""
+    job_id = job_id or str(uuid.uuid4())
+    get_store().create(
+        job_id,
+        {
+            "state": STATE_QUEUED,
+            "current": 0,
+            "total": total,
+            "message": message,
+            "user": str(user_id) if user_id else "",
+        },
+    )
+    return job_id
+
+
+def report_progress(
+    job_id: str, current: int, total: int | None = None, message: str | None = None
+) -> None:
+    """Set absolute progress for a tracked job (no-op if untracked)."""
+    fields: dict[str, Any] = {"state": STATE_RUNNING, "current": current}
+    if total is not None:
+        fields["total"] = total
+    if message is not None:
+        fields["message"] = message
+    get_store().update(job_id, fields)
+
+
+def advance(job_id: str, amount: int = 1, message: str | None = None) -> None:
+    """Atomically add ``amount`` to ``current``; completes the job at ``total``.
+
+    Intended for jobs split across several tasks (e.g. email batches).
+    """
+    fields = {"message": message} if message is not None else {}
+    data = get_store().update(job_id, fields, incr={"current": amount})
+    if data and data["total"] and data["current"] >= data["total"]:
+        if data.get("state") not in TERMINAL_STATES:
+            get_store().update(job_id, {"state": STATE_SUCCEEDED})
+
+
+def mark_running(job_id: str) -> None:
+    get_store().update(job_id, {"state": STATE_RUNNING})
+
+
+def mark_succeeded(job_id: str, result: Any = None) -> None:
+    fields = {"state": STATE_SUCCEEDED}
+    if result is not None:
+        fields["result"] = json.dumps(result, default=str)
+    get_store().update(job_id, fields)
+
+
+def mark_failed(job_id: str, error: str) -> None:
+    get_store().update(job_id, {"state": STATE_FAILED, "message": error[:500]})
+
+
+def get_status(job_id: str) -> dict[str, Any] | None:
+    data = get_store().get(job_id)
+    if data and "result" in data:
+        data["result"] = json.loads(data["result"])
+    return data
+
+
+def wait_for_change(
+    job_id: str, after_version: int, timeout: float
+) -> dict[str, Any] | None:
+    """Block until the job's version exceeds ``after_version`` or timeout."""
+    current = get_status(job_id)
+    if (
+        current is not None
+        and current["version"] <= after_version
+        and current["state"] not in TERMINAL_STATES
+        and timeout > 0
+    ):
+        get_store().wait(job_id, after_version, timeout)
+        current = get_status(job_id)
+    return current
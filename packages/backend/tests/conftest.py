@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _sync_audit_sink(settings):
+    # Background audit flushes would write outside the test transaction
+    settings.AUDIT_SINK = "sync"
@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.admin_api.audit import BufferedSink
+from apps.admin_api.models import AdminAudit
+
+
+@pytest.fixture
+def admin_client(db):
+    User = get_user_model()
+    admin = User.objects.create_superuser(email="admin@example.com", password="x")
+    client = APIClient()
+    client.force_authenticate(admin)
+    return admin, client
+
+
+def test_buffered_sink_writes_in_batches(db, monkeypatch, settings):
+    settings.AUDIT_FLUSH_BATCH_SIZE = 2
+    monkeypatch.setattr(BufferedSink, "_ensure_thread", lambda self: None)
+    sink = BufferedSink()
+    for i in range(3):
+        sink.write(AdminAudit(path="/x", method="GET", action=f"a{i}"))
+
+    assert not AdminAudit.objects.exists()
+    assert sink.flush() == 3
+    assert AdminAudit.objects.count() == 3
+    assert sink.flush() == 0
+
+
+def test_admin_view_records_audit(admin_client):
+    admin, client = admin_client
+    assert client.get("/admin/api/ping").status_code == 200
+    entry = AdminAudit.objects.get()
+    assert entry.user == admin
+    assert entry.action == "ping"
+
+
+def test_audit_query_filters_and_keyset_pages(admin_client):
+    admin, client = admin_client
+    now = timezone.now()
+    for i in range(5):
+        AdminAudit.objects.create(
+            user=admin,
+            path="/admin/api/features",
+            method="POST",
+            action=f"featureflag_create:f{i}",
+            created_at=now - timedelta(minutes=i),
+        )
+    AdminAudit.objects.create(path="/admin/api/ping", method="GET", action="ping")
+    AdminAudit.objects.create(
+        user=admin,
+        path="/admin/api/features",
+        method="POST",
+        action="featureflag_create:old",
+        created_at=now - timedelta(days=2),
+    )
+
+    since = (now - timedelta(days=1)).isoformat()
+    params = {"action": "featureflag_", "user": str(admin.id), "since": since}
+    resp = client.get("/admin/api/audit", {**params, "limit": 2})
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [r["action"] for r in body["data"]] == [
+        "featureflag_create:f0",
+        "featureflag_create:f1",
+    ]
+
+    seen = [r["action"] for r in body["data"]]
+    while body["next_cursor"]:
+        body = client.get(
+            "/admin/api/audit", {**params, "limit": 2, "cursor": body["next_cursor"]}
+        ).json()
+        seen += [r["action"] for r in body["data"]]
+    assert seen == [f"featureflag_create:f{i}" for i in range(5)]
+
+
+def test_audit_query_rejects_bad_cursor(admin_client):
+    _admin, client = admin_client
+    resp = client.get("/admin/api/audit", {"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
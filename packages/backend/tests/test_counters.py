@@ -0,0 +1,72 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from apps.notifications.models import DeviceToken
+from apps.organizations.models import Membership, Organization
+
+
+@pytest.mark.django_db
+def test_member_count_follows_memberships():
+    User = get_user_model()
+    owner = User.objects.create_user(email="owner@example.com", password="x")
+    org = Organization.objects.create(name="Team", owner=owner)
+    other = Organization.objects.create(name="Other", owner=owner)
+    members = [
+        User.objects.create_user(email=f"m{i}@example.com", password="x")
+        for i in range(3)
+    ]
+    for user in members:
+        Membership.objects.create(user=user, organization=org)
+    org.refresh_from_db()
+    assert org.member_count == 3
+
+    Membership.objects.get(user=members[0]).delete()
+    moved = Membership.objects.get(user=members[1])
+    moved.organization = other
+    moved.save()
+    Membership.objects.filter(user=members[2]).delete()
+
+    org.refresh_from_db()
+    other.refresh_from_db()
+    assert (org.member_count, other.member_count) == (0, 1)
+
+
+@pytest.mark.django_db
+def test_device_token_count_and_admin_listing():
+    User = get_user_model()
+    admin = User.objects.create_superuser(email="admin@example.com", password="x")
+    user = User.objects.create_user(email="u@example.com", password="x")
+    client = APIClient()
+    client.force_authenticate(user)
+    for token in ("a", "b", "a"):
+        client.post("/api/push/register/", {"token": token}, format="json")
+    user.refresh_from_db()
+    assert user.device_token_count == 2
+
+    # Re-registering the token from another account moves it
+    client.force_authenticate(admin)
+    client.post("/api/push/register/", {"token": "b"}, format="json")
+    user.refresh_from_db()
+    admin.refresh_from_db()
+    assert (user.device_token_count, admin.device_token_count) == (1, 1)
+
+    resp = client.get("/admin/api/users?email=u@")
+    assert resp.json()["users"][0]["token_count"] == 1
+
+
+@pytest.mark.django_db
+def test_reconcile_repairs_drift():
+    User = get_user_model()
+    user = User.objects.create_user(email="u@example.com", password="x")
+    org = Organization.objects.create(name="Team", owner=user)
+    Membership.objects.create(user=user, organization=org)
+    DeviceToken.objects.bulk_create([DeviceToken(user=user, token="t")])
+    Organization.objects.filter(pk=org.pk).update(member_count=7)
+
+    call_command("reconcile_counters", "--batch-size", "1")
+
+    user.refresh_from_db()
+    org.refresh_from_db()
+    assert (user.device_token_count, org.member_count) == (1, 1)
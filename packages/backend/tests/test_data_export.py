@@ -0,0 +1,64 @@
+import gzip
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from apps.notifications.models import DeviceToken, Notification
+from apps.organizations.models import Membership, Organization
+from apps.outbox.models import OutboxMessage
+from apps.users.tasks import export_user_data
+from boilerplate import task_status
+
+
+@pytest.fixture
+def export_storage(settings, tmp_path):
+    settings.STORAGES = {
+        **settings.STORAGES,
+        "exports": {
+            "BACKEND": "django.core.files.storage.FileSystemStorage",
+            "OPTIONS": {"location": str(tmp_path)},
+        },
+    }
+    return tmp_path
+
+
+@pytest.mark.django_db
+def test_export_job_streams_archive_and_download(export_storage):
+    User = get_user_model()
+    user = User.objects.create_user(email="me@example.com", password="x")
+    other = User.objects.create_user(email="other@example.com", password="x")
+    org = Organization.objects.create(name="Team", owner=user)
+    Membership.objects.create(user=user, organization=org)
+    for i in range(3):
+        Notification.objects.create(recipient=user, message=f"n{i}", type="t")
+    Notification.objects.create(recipient=other, message="not mine", type="t")
+    DeviceToken.objects.create(user=user, token="tok")
+    client = APIClient()
+    client.force_authenticate(user)
+
+    resp = client.post("/api/v1/me/export")
+    assert resp.status_code == 202
+    job_id = resp.json()["data"]["job_id"]
+    assert OutboxMessage.objects.filter(task_name=export_user_data.name).exists()
+    assert client.get(f"/api/v1/me/export/{job_id}").status_code == 404
+
+    export_user_data(str(user.id), job_id)
+
+    assert task_status.get_status(job_id)["state"] == task_status.STATE_SUCCEEDED
+    resp = client.get(f"/api/v1/me/export/{job_id}")
+    assert resp.status_code == 200
+    assert resp["Content-Type"] == "application/gzip"
+    lines = gzip.decompress(b"".join(resp.streaming_content)).splitlines()
+    records = [json.loads(line) for line in lines]
+    types = [r["type"] for r in records]
+    assert types.count("notification") == 3
+    assert types.count("profile") == types.count("device_token") == 1
+    assert records[0]["data"]["email"] == "me@example.com"
+    device = next(r for r in records if r["type"] == "device_token")
+    assert "token" not in device["data"]
+
+    # Another user cannot fetch it
+    client.force_authenticate(other)
+    assert client.get(f"/api/v1/me/export/{job_id}").status_code == 404
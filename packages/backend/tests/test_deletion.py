@@ -0,0 +1,91 @@
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from apps.admin_api.models import AdminAudit
+from apps.notifications.models import Notification
+from apps.organizations.models import Membership, Organization, OrganizationInvite
+from apps.organizations.tasks import delete_organization
+from apps.outbox.models import OutboxMessage
+from apps.users.tasks import delete_user_account
+from boilerplate import task_status
+
+
+@pytest.fixture
+def team(db):
+    User = get_user_model()
+    owner = User.objects.create_user(email="owner@example.com", password="x")
+    org = Organization.objects.create(name="Team", owner=owner, is_personal=False)
+    Membership.objects.create(user=owner, organization=org, role=Membership.ROLE_ADMIN)
+    for i in range(5):
+        member = User.objects.create_user(email=f"m{i}@example.com", password="x")
+        Membership.objects.create(user=member, organization=org)
+    owner.current_organization = org
+    owner.save(update_fields=["current_organization"])
+    return owner, org
+
+
+def test_close_organization_returns_202_and_deletes_in_chunks(team, settings):
+    owner, org = team
+    settings.DELETION_CHUNK_SIZE = 2
+    settings.DELETION_CHUNK_SLEEP_SECONDS = 0
+    client = APIClient()
+    client.force_authenticate(owner)
+
+    resp = client.delete(
+        f"/api/v1/organizations/{org.id}/close/", {"name": "Team"}, format="json"
+    )
+
+    assert resp.status_code == 202, resp.content
+    job_id = resp.json()["data"]["job_id"]
+    # Hidden immediately, rows still there until the task runs
+    assert client.get("/api/v1/organizations/").json()["count"] == 0
+    assert client.get(f"/api/v1/organizations/{org.id}/").status_code == 404
+    assert Membership.objects.filter(organization=org).count() == 6
+    message = OutboxMessage.objects.get(task_name=delete_organization.name)
+    assert message.kwargs == {"job_id": job_id}
+
+    delete_organization(str(org.id), job_id=job_id)
+
+    assert not Organization.objects.filter(id=org.id).exists()
+    assert not Membership.objects.filter(organization_id=org.id).exists()
+    status = task_status.get_status(job_id)
+    assert status["state"] == task_status.STATE_SUCCEEDED
+    assert status["current"] == status["total"] == 7
+
+
+def test_admin_delete_user_deactivates_then_deletes(team, settings):
+    owner, org = team
+    settings.DELETION_CHUNK_SIZE = 2
+    settings.DELETION_CHUNK_SLEEP_SECONDS = 0
+    User = get_user_model()
+    admin = User.objects.create_superuser(email="admin@example.com", password="x")
+    for i in range(3):
+        Notification.objects.create(recipient=owner, message=f"n{i}", type="t")
+    OrganizationInvite.objects.create(
+        organization=org,
+        invited_email="new@example.com",
+        invited_by=owner,
+        token_hash="t",
+        expires_at=org.created_at,
+    )
+    AdminAudit.objects.create(user=owner, path="/x", method="GET", action="ping")
+    client = APIClient()
+    client.force_authenticate(admin)
+
+    resp = client.delete(f"/admin/api/users/{owner.id}")
+
+    assert resp.status_code == 202, resp.content
+    owner.refresh_from_db()
+    assert not owner.is_active
+    assert owner.deletion_requested_at is not None
+    assert client.delete(f"/admin/api/users/{owner.id}").status_code == 409
+
+    delete_user_account(str(owner.id), job_id=resp.json()["job_id"])
+
+    assert not User.objects.filter(id=owner.id).exists()
+    assert not Organization.objects.filter(id=org.id).exists()
+    assert not Notification.objects.filter(recipient_id=owner.id).exists()
+    # Audit history is kept, detached from the deleted account
+    assert AdminAudit.objects.filter(action="ping", user__isnull=True).exists()
+    assert User.objects.filter(email="m0@example.com").exists()
@@ -88,3 +88,79 @@ def test_magic_link_invalid_token(client: APIClient):
     resp = client.post(url_verify, {"token": "totallyinvalid"}, format="json")
     assert resp.status_code == 400
     assert resp.data["error"] == "invalid_or_expired"
+
+
+@pytest.mark.django_db
+def test_magic_link_request_dispatches_email_task_on_commit(
+    client: APIClient, settings, monkeypatch, django_capture_on_commit_callbacks
+):
+    from apps.users import tasks
+
+    settings.MAGIC_LINK_VERIFY_URL = "https://example.com"
+    calls = []
+    monkeypatch.setattr(
+        tasks.send_magic_link_email, "delay", lambda *args: calls.append(args)
+    )
+    url_request = reverse("public_api:magic-request")
+    with django_capture_on_commit_callbacks(execute=True):
+        resp = client.post(url_request, {"email": "async@example.com"}, format="json")
+    assert resp.status_code == 202
+    assert len(calls) == 1
+    assert calls[0][0] == "async@example.com"
+
+
+def test_send_magic_link_email_task_uses_template(settings, mailoutbox):
+    from apps.users.tasks import send_magic_link_email
+
+    settings.MAGIC_LINK_VERIFY_URL = "https://example.com"
+    send_magic_link_email("mail@example.com", "12345678")
+    assert len(mailoutbox) == 1
+    message = mailoutbox[0]
+    assert message.to == ["mail@example.com"]
+    assert "https://example.com/magic-verify/12345678" in message.body
+    assert message.alternatives and "12345678" in message.alternatives[0][0]
+
+
+@pytest.mark.django_db
+def test_magic_link_repeat_request_is_coalesced(client: APIClient, settings):
+    from django.core.cache import cache
+
+    cache.clear()
+    settings.DEBUG = True
+    settings.MAGIC_LINK_DEBUG_ECHO_TOKEN = True
+    settings.MAGIC_LINK_VERIFY_URL = "https://example.com"
+    settings.MAGIC_LINK_COALESCE_SECONDS = 60
+    url_request = reverse("public_api:magic-request")
+    resp1 = client.post(url_request, {"email": "twice@example.com"}, format="json")
+    resp2 = client.post(url_request, {"email": "twice@example.com"}, format="json")
+    assert resp1.status_code == resp2.status_code == 202
+    assert resp1.data["debug_token"] == resp2.data["debug_token"]
+    assert MagicLink.objects.filter(email="twice@example.com").count() == 1
+
+    # After a successful verify a new request mints a fresh code
+    url_verify = reverse("public_api:magic-verify")
+    ok = client.post(url_verify, {"token": resp1.data["debug_token"]}, format="json")
+    assert ok.status_code == 200
+    resp3 = client.post(url_request, {"email": "twice@example.com"}, format="json")
+    assert resp3.data["debug_token"] != resp1.data["debug_token"]
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_magic_link_verify_failures_are_rejected_before_db(
+    client: APIClient, settings, django_assert_num_queries
+):
+    from django.core.cache import cache
+
+    cache.clear()
+    settings.MAGIC_LINK_VERIFY_MAX_FAILURES_PER_EMAIL = 2
+    url_verify = reverse("public_api:magic-verify")
+    body = {"token": "00000000", "email": "victim@example.com"}
+    for _ in range(2):
+        resp = client.post(url_verify, body, format="json")
+        assert resp.status_code == 400
+    with django_assert_num_queries(0):
+        blocked = client.post(url_verify, body, format="json")
+    assert blocked.status_code == 429
+    assert "Retry-After" in blocked.headers
+    cache.clear()
@@ -0,0 +1,83 @@
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from apps.organizations.models import Membership, Organization, OrganizationInvite
+
+
+@pytest.fixture
+def team_org(db):
+    User = get_user_model()
+    admin = User.objects.create_user(email="owner@example.com", password="x")
+    org = Organization.objects.create(name="Team", owner=admin, is_personal=False)
+    Membership.objects.create(user=admin, organization=org, role=Membership.ROLE_ADMIN)
+    return admin, org
+
+
+@pytest.mark.django_db
+def test_bulk_invite_returns_per_email_results(team_org):
+    from apps.outbox.models import OutboxMessage
+
+    admin, org = team_org
+    member = get_user_model().objects.create_user(email="Member@Example.com")
+    Membership.objects.create(user=member, organization=org)
+
+    client = APIClient()
+    client.force_authenticate(admin)
+    payload = {
+        "invites": [
+            {"invited_email": "a@example.com", "role": "admin"},
+            {"invited_email": "B@example.com"},
+            {"invited_email": "a@example.com"},
+            {"invited_email": "member@example.com"},
+            {"invited_email": "not-an-email"},
+        ]
+    }
+    resp = client.post(
+        f"/api/v1/organizations/{org.id}/invites/bulk/", payload, format="json"
+    )
+
+    assert resp.status_code == 201, resp.content
+    statuses = [r["status"] for r in resp.data["data"]]
+    assert statuses == ["invited", "invited", "duplicate", "already_member", "invalid"]
+    assert resp.data["invited"] == 2
+    assert resp.data["data"][0]["role"] == "admin"
+
+    pending = OrganizationInvite.objects.filter(
+        organization=org, status=OrganizationInvite.STATUS_PENDING
+    )
+    assert set(pending.values_list("invited_email", flat=True)) == {
+        "a@example.com",
+        "b@example.com",
+    }
+    # Emails are handed to the outbox as one batch, not sent in the request
+    (message,) = OutboxMessage.objects.all()
+    assert message.task_name.endswith("send_org_invite_emails_batch")
+    assert len(message.args[0]) == 2
+
+
+@pytest.mark.django_db
+def test_invite_email_batch_task_sends_pending_invites(team_org, mailoutbox):
+    from apps.organizations.tasks import send_org_invite_emails_batch
+
+    admin, org = team_org
+    invites = [
+        OrganizationInvite.objects.create(
+            organization=org,
+            invited_email=f"user{i}@example.com",
+            invited_by=admin,
+            token_hash=f"hash{i}",
+            expires_at="2099-01-01T00:00:00Z",
+        )
+        for i in range(3)
+    ]
+    invites[2].status = OrganizationInvite.STATUS_REVOKED
+    invites[2].save(update_fields=["status"])
+
+    sent = send_org_invite_emails_batch([str(i.id) for i in invites])
+
+    assert sent == 2
+    assert sorted(m.to[0] for m in mailoutbox) == [
+        "user0@example.com",
+        "user1@example.com",
+    ]
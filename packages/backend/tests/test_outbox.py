@@ -0,0 +1,55 @@
+import pytest
+from django.db import transaction
+
+from apps.outbox import relay
+from apps.outbox.models import OutboxMessage
+
+
+class _FakeApp:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.sent = []
+
+    def send_task(self, name, args=None, kwargs=None):
+        if self.fail:
+            raise ConnectionError("broker down")
+        self.sent.append((name, args, kwargs))
+
+
+@pytest.mark.django_db
+def test_rolled_back_transaction_leaves_no_outbox_row():
+    with pytest.raises(RuntimeError), transaction.atomic():
+        relay.enqueue_task("apps.example.tasks.noop", 1)
+        raise RuntimeError("rollback")
+    assert not OutboxMessage.objects.exists()
+
+
+@pytest.mark.django_db
+def test_relay_publishes_pending_messages(monkeypatch):
+    app = _FakeApp()
+    monkeypatch.setattr(relay, "current_app", app)
+    relay.enqueue_task("apps.example.tasks.noop", 1, flag=True)
+    relay.enqueue_many("apps.example.tasks.batch", [[["a", "b"]], [["c"]]])
+
+    assert relay.relay_batch(batch_size=10) == 3
+    assert ("apps.example.tasks.noop", [1], {"flag": True}) in app.sent
+    assert not OutboxMessage.objects.filter(published_at__isnull=True).exists()
+    # Nothing left to publish on the next pass
+    assert relay.relay_batch(batch_size=10) == 0
+
+
+@pytest.mark.django_db
+def test_relay_backs_off_when_broker_is_down(monkeypatch):
+    monkeypatch.setattr(relay, "current_app", _FakeApp(fail=True))
+    message = relay.enqueue_task("apps.example.tasks.noop")
+
+    assert relay.relay_batch() == 0
+    message.refresh_from_db()
+    assert message.published_at is None
+    assert message.attempts == 1
+    assert "broker down" in message.last_error
+    assert message.available_at > message.created_at
+    # Not retried before the backoff elapses
+    assert relay.relay_batch() == 0
+    message.refresh_from_db()
+    assert message.attempts == 1
@@ -0,0 +1,55 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import get_hasher
+from rest_framework.test import APIClient
+
+from boilerplate import hashers
+
+
+@pytest.fixture
+def executor(settings):
+    settings.PASSWORD_HASH_WORKERS = 1
+    settings.PASSWORD_HASH_MAX_PENDING = 0
+    settings.PASSWORD_HASH_WAIT_SECONDS = 0.05
+    settings.PASSWORD_HASH_RETRY_AFTER_SECONDS = 2
+    hashers.reset_executor()
+    yield hashers.get_executor()
+    hashers.reset_executor()
+
+
+@pytest.mark.django_db
+def test_login_hashes_on_the_executor(executor):
+    assert isinstance(get_hasher(), hashers.BoundedPBKDF2PasswordHasher)
+    get_user_model().objects.create_user(email="u@example.com", password="pw-123456")
+    resp = APIClient().post(
+        "/api/auth/jwt/token/",
+        {"email": "u@example.com", "password": "pw-123456"},
+        format="json",
+    )
+    assert resp.status_code == 200, resp.content
+
+
+@pytest.mark.django_db
+def test_full_executor_returns_503_with_retry_after(executor):
+    get_user_model().objects.create_user(email="u@example.com", password="pw-123456")
+    # Occupy the only slot, as a concurrent login would
+    assert executor._slots.acquire(timeout=1)
+    try:
+        resp = APIClient().post(
+            "/api/auth/jwt/token/",
+            {"email": "u@example.com", "password": "pw-123456"},
+            format="json",
+        )
+    finally:
+        executor._slots.release()
+
+    assert resp.status_code == 503, resp.content
+    assert resp["Retry-After"] == "2"
+
+
+def test_pbkdf2_iterations_are_configurable(settings):
+    settings.PASSWORD_PBKDF2_ITERATIONS = 1000
+    hasher = hashers.BoundedPBKDF2PasswordHasher()
+    assert hasher.iterations == 1000
+    settings.PASSWORD_PBKDF2_ITERATIONS = 0
+    assert hasher.iterations > 1000
@@ -0,0 +1,79 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.organizations.models import Membership
+from apps.users.magic_link import create_magic_link
+from apps.users.provisioning import create_personal_organization
+
+
+def _statements(ctx):
+    """Queries minus the savepoints of the per-test transaction."""
+    return [
+        q["sql"]
+        for q in ctx.captured_queries
+        if not q["sql"].startswith(("SAVEPOINT", "RELEASE SAVEPOINT"))
+    ]
+
+
+@pytest.fixture
+def b2c(settings):
+    settings.APP_MODE = "b2c"
+
+
+@pytest.mark.django_db
+def test_register_query_budget(b2c):
+    client = APIClient()
+    with CaptureQueriesContext(connection) as ctx:
+        resp = client.post(
+            "/api/auth/register/",
+            {
+                "email": "new@example.com",
+                "password": "s3cret-Pass!",
+                "first_name": "Ann",
+            },
+            format="json",
+        )
+
+    assert resp.status_code == 201, resp.content
+    # email check, user, organization, membership, outstanding JWT
+    assert len(_statements(ctx)) == 5
+    org = resp.json()["user"]["current_organization"]
+    assert org["name"] == "Ann's Workspace"
+    user = get_user_model().objects.get(email="new@example.com")
+    assert str(user.current_organization_id) == org["id"]
+    assert user.current_organization.member_count == 1
+    assert Membership.objects.get(user=user).role == Membership.ROLE_ADMIN
+
+
+@pytest.mark.django_db
+def test_first_magic_link_login_query_budget(b2c):
+    created = create_magic_link("fresh@example.com")
+    client = APIClient()
+    with CaptureQueriesContext(connection) as ctx:
+        resp = client.post(
+            "/api/auth/magic/verify/", {"token": created.raw_token}, format="json"
+        )
+
+    assert resp.status_code == 200, resp.content
+    # link (+ user, org), user, organization, membership, link delete, JWT
+    assert len(_statements(ctx)) == 6
+    assert resp.json()["user"]["current_organization"]["name"] == "fresh's Workspace"
+
+
+@pytest.mark.django_db
+def test_existing_user_without_workspace_gets_one(settings):
+    settings.APP_MODE = "b2b"
+    created = create_magic_link("team@example.com")
+    client = APIClient()
+    client.post("/api/auth/magic/verify/", {"token": created.raw_token}, format="json")
+    user = get_user_model().objects.get(email="team@example.com")
+    assert user.current_organization is None
+
+    settings.APP_MODE = "b2c"
+    org = create_personal_organization(user)
+    user.refresh_from_db()
+    assert user.current_organization == org
+    assert org.member_count == 1
@@ -0,0 +1,96 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from apps.notifications.models import Notification
+from apps.organizations.models import Organization, OrganizationInvite
+from apps.public_api.models import IdempotencyKey
+from apps.retention.metrics import ROWS_PURGED
+from apps.retention.policies import get_policy
+from apps.retention.purge import purge
+from apps.users.models import MagicLink
+
+
+def _purged(policy_name):
+    return ROWS_PURGED.labels(policy_name)._value.get()
+
+
+@pytest.mark.django_db
+def test_purge_deletes_expired_rows_in_batches():
+    now = timezone.now()
+    for i in range(5):
+        MagicLink.objects.create(
+            email=f"old{i}@example.com",
+            token_hash=f"old{i}",
+            expires_at=now - timedelta(days=2),
+        )
+    fresh = MagicLink.objects.create(
+        email="new@example.com", token_hash="new", expires_at=now
+    )
+    before = _purged("magic_links")
+
+    deleted = purge(get_policy("magic_links"), batch_size=2, sleep=0)
+
+    assert deleted == 5
+    assert list(MagicLink.objects.all()) == [fresh]
+    assert _purged("magic_links") - before == 5
+
+
+@pytest.mark.django_db
+def test_policies_keep_rows_that_are_still_needed(settings):
+    User = get_user_model()
+    user = User.objects.create_user(email="owner@example.com", password="x")
+    org = Organization.objects.create(name="Team", owner=user, is_personal=False)
+    old = timezone.now() - timedelta(days=60)
+    for status in (
+        OrganizationInvite.STATUS_ACCEPTED,
+        OrganizationInvite.STATUS_EXPIRED,
+    ):
+        OrganizationInvite.objects.create(
+            organization=org,
+            invited_email=f"{status}@example.com",
+            status=status,
+            token_hash=status,
+            expires_at=old,
+        )
+    Notification.objects.create(recipient=user, message="read", type="t", read_at=old)
+    Notification.objects.create(recipient=user, message="unread", type="t")
+    key = IdempotencyKey.objects.create(method="POST", path="/x", key="k")
+    IdempotencyKey.objects.filter(pk=key.pk).update(created_at=old)
+    OutstandingToken.objects.create(jti="a", token="t", expires_at=old)
+    OutstandingToken.objects.create(
+        jti="b", token="t", expires_at=timezone.now() + timedelta(days=1)
+    )
+    settings.RETENTION_BATCH_SLEEP_SECONDS = 0
+
+    call_command(
+        "purge_retention",
+        "org_invites",
+        "notifications",
+        "idempotency_keys",
+        "jwt_outstanding_tokens",
+    )
+
+    assert list(OrganizationInvite.objects.values_list("status", flat=True)) == [
+        OrganizationInvite.STATUS_ACCEPTED
+    ]
+    assert list(Notification.objects.values_list("message", flat=True)) == ["unread"]
+    assert not IdempotencyKey.objects.exists()
+    assert list(OutstandingToken.objects.values_list("jti", flat=True)) == ["b"]
+
+
+@pytest.mark.django_db
+def test_keep_days_override(settings):
+    MagicLink.objects.create(
+        email="a@example.com",
+        token_hash="a",
+        expires_at=timezone.now() - timedelta(days=2),
+    )
+    settings.RETENTION_KEEP_DAYS = {"magic_links": 7}
+
+    assert purge(get_policy("magic_links"), sleep=0) == 0
+    assert MagicLink.objects.count() == 1
@@ -0,0 +1,76 @@
+from unittest import mock
+
+import pytest
+from celery import Task, shared_task
+from django.core.cache import cache
+
+from boilerplate.dedup import DeduplicatedTask
+
+calls = []
+
+
+@shared_task(base=DeduplicatedTask, name="tests.dedup_example")
+def dedup_example(value, fail=False):
+    calls.append(value)
+    if fail:
+        raise RuntimeError("provider error")
+    return value
+
+
+def _published(args, kwargs, task_id=None, **options):
+    return dedup_example.AsyncResult(task_id)
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    cache.clear()
+    calls.clear()
+    yield
+    cache.clear()
+
+
+def test_duplicate_enqueue_is_merged_into_first_task():
+    with mock.patch.object(Task, "apply_async", side_effect=_published) as publish:
+        first = dedup_example.apply_async(("a",))
+        second = dedup_example.apply_async(("a",))
+        other = dedup_example.apply_async(("b",))
+
+    assert publish.call_count == 2
+    assert second.id == first.id
+    assert other.id != first.id
+
+
+def test_caller_supplied_key_overrides_arguments():
+    with mock.patch.object(Task, "apply_async", side_effect=_published) as publish:
+        first = dedup_example.apply_async(("a",), dedup_key="invite:1")
+        second = dedup_example.apply_async(("b",), dedup_key="invite:1")
+
+    assert publish.call_count == 1
+    assert second.id == first.id
+    assert publish.call_args.args[1] == {"_dedup_key": "invite:1"}
+
+
+def test_completed_key_skips_duplicate_execution():
+    assert dedup_example("a") == "a"
+    assert dedup_example("a") is None
+    assert calls == ["a"]
+    # A finished key also suppresses new enqueues
+    with mock.patch.object(Task, "apply_async") as publish:
+        dedup_example.apply_async(("a",))
+    publish.assert_not_called()
+
+
+def test_failed_run_releases_lock_for_retry():
+    with pytest.raises(RuntimeError):
+        dedup_example("a", fail=True)
+    with pytest.raises(RuntimeError):
+        dedup_example("a", fail=True)
+    assert calls == ["a", "a"]
+
+
+def test_concurrent_duplicate_execution_is_skipped():
+    key = dedup_example._cache_keys(("a",), {})[1]
+    cache.add(key, "other-worker-task-id")
+
+    assert dedup_example("a") is None
+    assert calls == []
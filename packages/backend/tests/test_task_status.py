@@ -0,0 +1,56 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from boilerplate import task_status
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_progress_bumps_version_and_completes_multi_task_job():
+    job_id = task_status.track_task("u1", total=4)
+    first = task_status.get_status(job_id)
+    assert first["state"] == task_status.STATE_QUEUED
+    assert first["version"] == 1
+
+    task_status.advance(job_id, 2)
+    mid = task_status.get_status(job_id)
+    assert mid["current"] == 2 and mid["version"] > first["version"]
+
+    task_status.advance(job_id, 2)
+    assert task_status.get_status(job_id)["state"] == task_status.STATE_SUCCEEDED
+
+
+def test_untracked_jobs_are_ignored():
+    task_status.report_progress("not-tracked", 1, 2)
+    assert task_status.get_status("not-tracked") is None
+
+
+@pytest.mark.django_db
+def test_task_status_endpoint_is_owner_only_and_long_polls():
+    User = get_user_model()
+    owner = User.objects.create_user(email="owner@example.com")
+    other = User.objects.create_user(email="other@example.com")
+    job_id = task_status.track_task(owner.id, total=2)
+    task_status.report_progress(job_id, 1)
+
+    client = APIClient()
+    client.force_authenticate(other)
+    assert client.get(f"/api/v1/tasks/{job_id}").status_code == 404
+
+    client.force_authenticate(owner)
+    resp = client.get(f"/api/v1/tasks/{job_id}")
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert data["current"] == 1 and data["total"] == 2
+    assert "user" not in data
+
+    # A newer version than the client's returns immediately
+    resp = client.get(f"/api/v1/tasks/{job_id}", {"version": 0, "wait": 20})
+    assert resp.json()["data"]["version"] == data["version"]
@@ -0,0 +1,81 @@
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from apps.organizations.models import Membership
+
+
+@pytest.fixture
+def admin_client(db):
+    User = get_user_model()
+    admin = User.objects.create_superuser(email="admin@example.com", password="x")
+    client = APIClient()
+    client.force_authenticate(admin)
+    return client
+
+
+def test_csv_import_provisions_personal_orgs_in_batches(
+    admin_client, settings, django_assert_max_num_queries
+):
+    settings.APP_MODE = "b2c"
+    settings.USER_IMPORT_BATCH_SIZE = 50
+    hashed = make_password("secret")
+    lines = ["email,first_name,last_name,password"]
+    lines += [f"user{i}@Example.com,U{i},Last," for i in range(120)]
+    lines += [
+        f"hashed@example.com,Ann,,{hashed}",
+        "admin@example.com,Dup,,",
+        "user0@example.com,Again,,",
+        "not-an-email,,,",
+        "plain@example.com,,,plaintext",
+    ]
+
+    # 3 batches x 6 statements (+ savepoints), independent of the row count
+    with django_assert_max_num_queries(40):
+        resp = admin_client.post(
+            "/admin/api/users/import",
+            "\n".join(lines).encode(),
+            content_type="text/csv",
+        )
+
+    assert resp.status_code == 200, resp.content
+    data = resp.json()["data"]
+    assert (data["created"], data["skipped"], data["failed"]) == (121, 2, 2)
+    assert [e["line"] for e in data["errors"]] == [125, 126]
+
+    User = get_user_model()
+    user = User.objects.select_related("current_organization").get(
+        email="user7@example.com"
+    )
+    assert not user.has_usable_password()
+    assert user.current_organization.name == "U7's Workspace"
+    assert user.current_organization.member_count == 1
+    assert Membership.objects.get(user=user).role == Membership.ROLE_ADMIN
+    assert User.objects.get(email="hashed@example.com").check_password("secret")
+
+
+def test_ndjson_import_b2b_and_command(admin_client, settings, tmp_path):
+    settings.APP_MODE = "b2b"
+    body = "\n".join(
+        [json.dumps({"email": "a@example.com"}), "{broken", "", json.dumps([1])]
+    )
+    resp = admin_client.post(
+        "/admin/api/users/import", body, content_type="application/x-ndjson"
+    )
+    data = resp.json()["data"]
+    assert (data["created"], data["failed"]) == (1, 2)
+    assert (
+        get_user_model().objects.get(email="a@example.com").current_organization is None
+    )
+
+    path = tmp_path / "users.ndjson"
+    path.write_text(json.dumps({"email": "b@example.com"}) + "\n")
+    call_command("import_users", str(path))
+    assert get_user_model().objects.filter(email="b@example.com").exists()
+
+    bad = admin_client.post("/admin/api/users/import", "x", content_type="text/plain")
+    assert bad.status_code == 415